@@ -1,10 +1,3 @@
-from scraper_framework.adapters.registry import register
-from scraper_framework.adapters.sites.books_toscrape import BooksToScrapeAdapter
-from scraper_framework.adapters.sites.directory_generic import GenericDirectoryAdapter
-from scraper_framework.adapters.sites.dynamic_test import DynamicTestAdapter
+from scraper_framework.adapters.sites import register_all
 
-
-def register_all() -> None:
-    register(BooksToScrapeAdapter())
-    register(GenericDirectoryAdapter())
-    register(DynamicTestAdapter())
+__all__ = ["register_all"]
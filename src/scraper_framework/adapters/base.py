@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol
+from typing import Any, Dict, Iterable, Optional, Protocol, Tuple
 
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card
@@ -16,10 +16,23 @@ class SiteAdapter(Protocol):
 
     def card_locator(self) -> str: ...
 
+    def card_locator_tag(self) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Optional (tag, css_class) hint for the outermost card element.
+
+        When provided, HTML parsing only builds the matching subtrees instead of
+        the whole document. card_locator() must still match inside those subtrees.
+        """
+        return None
+
     def field_locator(self, field: str) -> Optional[str]: ...
 
     def extract_source_url(self, card: Card, page: Page) -> Optional[str]: ...
 
     def extract_field(self, card: Card, field: str, page: Page) -> Any: ...
 
+    def extract_fields(self, card: Card, fields: Iterable[str], page: Page) -> Dict[str, Any]:
+        """Extract several fields from one card; override to share work across fields."""
+        return {field: self.extract_field(card, field, page) for field in fields}
+
     def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec]: ...
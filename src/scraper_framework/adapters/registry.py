@@ -14,9 +14,10 @@ def register(adapter: SiteAdapter) -> None:
 
 def get(key: str) -> SiteAdapter:
     """Retrieve a registered adapter by key."""
-    if key not in _ADAPTERS:
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
         raise KeyError(f"Adapter not registered: {key}")
-    return _ADAPTERS[key]
+    return adapter
 
 
 def get_registered_adapters():
@@ -1,14 +1,31 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Iterable, Optional
+
 from scraper_framework.adapters.registry import register
-from scraper_framework.adapters.sites.books_toscrape import BooksToScrapeAdapter
-from scraper_framework.adapters.sites.directory_generic import GenericDirectoryAdapter
-from scraper_framework.adapters.sites.dynamic_example import DynamicExampleAdapter
-from scraper_framework.adapters.sites.dynamic_test import DynamicTestAdapter
-from scraper_framework.adapters.sites.test_static import ScrapeStatic
-
-
-def register_all() -> None:
-    register(BooksToScrapeAdapter())
-    register(GenericDirectoryAdapter())
-    register(DynamicExampleAdapter())
-    register(DynamicTestAdapter())
-    register(ScrapeStatic())
+
+# (adapter key, module, class). Modules are only imported when their adapter is registered.
+_ADAPTER_SPECS = (
+    ("books_toscrape", "scraper_framework.adapters.sites.books_toscrape", "BooksToScrapeAdapter"),
+    ("directory_generic", "scraper_framework.adapters.sites.directory_generic", "GenericDirectoryAdapter"),
+    ("dynamic_example", "scraper_framework.adapters.sites.dynamic_example", "DynamicExampleAdapter"),
+    ("dynamic_test", "scraper_framework.adapters.sites.dynamic_test", "DynamicTestAdapter"),
+    ("test_static", "scraper_framework.adapters.sites.test_static", "ScrapeStatic"),
+)
+
+
+def register_all(keys: Optional[Iterable[str]] = None) -> None:
+    """
+    Register the built-in site adapters.
+
+    Args:
+        keys: Optional adapter keys to register. When given, only those adapter
+            modules are imported; unknown keys are left for registry.get() to report.
+    """
+    wanted = set(keys) if keys is not None else None
+    for key, module_name, class_name in _ADAPTER_SPECS:
+        if wanted is not None and key not in wanted:
+            continue
+        adapter_cls = getattr(import_module(module_name), class_name)
+        register(adapter_cls())
@@ -6,7 +6,7 @@ from scraper_framework.core.models import Page, RequestSpec
 
 
 def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec]:
-    params = dict(current.params or {})
+    params = current.params or {}
 
     max_click_pages = int(params.get("click_max_pages", 25))
     cursor = int(params.get("click_cursor", 0))
@@ -18,19 +18,16 @@ def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec
         self.log.info("Click stop: reached click_max_pages=%d", max_click_pages)
         return None
 
-    cards = getattr(page, "_cards_cache", [])
-    hrefs = set()
+    # Kept as a set across cycles; only checkpoints serialize it to a list.
+    seen_total = params.get("click_seen_hrefs")
+    if not isinstance(seen_total, set):
+        seen_total = set(seen_total or [])
 
-    for c in cards:
-        u = self.extract_source_url(c, page)
-        if u:
-            hrefs.add(u)
-
-    seen_total = set(params.get("click_seen_hrefs", []))
-    before = len(seen_total)
-    seen_total.update(hrefs)
+    new_hrefs = {u for c in page.cards if (u := self.extract_source_url(c, page)) and u not in seen_total}
+    # A new set: the current spec's one must stay as it was (with_params is copy-on-write).
+    seen_total = seen_total | new_hrefs
     after = len(seen_total)
-    gained = after - before
+    gained = len(new_hrefs)
 
     if gained == 0:
         stall += 1
@@ -43,20 +40,10 @@ def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec
 
     self.log.info("Click progress: cursor=%d unique_total=%d (+%d) stall=%d/%d", cursor, after, gained, stall, stall_limit)
 
-    params.update(
-        {
-            "click_action": "once",
-            "click_selector": params.get("click_selector") or "button.load-more",
-            "click_cursor": cursor + 1,
-            "click_stall_count": stall,
-            "click_seen_hrefs": list(seen_total),
-        }
-    )
-
-    return RequestSpec(
-        url=current.url,
-        headers=current.headers,
-        params=params,
-        method="GET",
-        body=None,
+    return current.with_params(
+        click_action="once",
+        click_selector=params.get("click_selector") or "button.load-more",
+        click_cursor=cursor + 1,
+        click_stall_count=stall,
+        click_seen_hrefs=seen_total,
     )
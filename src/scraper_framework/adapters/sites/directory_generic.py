@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Optional
-from urllib.parse import urljoin
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional
 
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card
-from scraper_framework.parse.html_utils import find_next_url
+from scraper_framework.parse.html_utils import find_next_url, join_url
 
 
 class GenericDirectoryAdapter(SiteAdapter):
@@ -15,6 +15,28 @@ class GenericDirectoryAdapter(SiteAdapter):
     Goal: scrape repeated business cards from a directory-like listing page.
     """
 
+    _FIELD_MAP = MappingProxyType(
+        {
+            "name": "h2, h3, .name, .title",
+            "category": ".category, .type, .tags",
+            "address": ".address, .location, address",
+            "phone": ".phone, .tel, a[href^='tel:']",
+            "website": "a.website, a[href^='http']",
+            "rating": ".rating, .stars, [data-rating]",
+            "reviews": ".reviews, [data-reviews]",
+            "detail:availability": ".availability",  # Fields prefixed with detail: are only used during enrichment
+        }
+    )
+
+    def __init__(self):
+        # Fields with custom extraction; everything else falls back to field_locator().
+        self._extract_dispatch: Dict[str, Callable[[Card], Any]] = {
+            "website": self._extract_website,
+            "phone": self._extract_phone,
+            "rating": self._extract_rating,
+            "reviews": self._extract_reviews,
+        }
+
     def key(self) -> str:
         """Return the adapter key."""
         return "directory_generic"
@@ -33,17 +55,7 @@ class GenericDirectoryAdapter(SiteAdapter):
     # --- Field locators (sub elements inside each card) ---
     def field_locator(self, field: str) -> Optional[str]:
         """Return CSS selector for a field."""
-        mapping = {
-            "name": "h2, h3, .name, .title",
-            "category": ".category, .type, .tags",
-            "address": ".address, .location, address",
-            "phone": ".phone, .tel, a[href^='tel:']",
-            "website": "a.website, a[href^='http']",
-            "rating": ".rating, .stars, [data-rating]",
-            "reviews": ".reviews, [data-reviews]",
-            "detail:availability": ".availability",  # Fields prefixed with detail: are only used during enrichment
-        }
-        return mapping.get(field)
+        return self._FIELD_MAP.get(field)
 
     def extract_source_url(self, card: Card, page: Page) -> Optional[str]:
         """Extract the source URL from a card."""
@@ -51,40 +63,41 @@ class GenericDirectoryAdapter(SiteAdapter):
         # best: link to the detail page
         href = card.get_attr("a[href]", "href")
         if href:
-            return urljoin(page.url, href)
+            return join_url(page.url, href)
         return None
 
     def extract_field(self, card: Card, field: str, page: Page) -> Any:
         """Extract a field value from a card."""
-        if field == "website":
-
-            # Prefer explicit website link, then any absolute http link.
-            href = card.get_attr("a.website[href]", "href") or card.get_attr("a[href^='http']", "href")
-            return href
-
-        if field == "phone":
-            tel = card.get_attr("a[href^='tel:']", "href")
-            if tel:
-                return tel.replace("tel:", "").strip()
-            return card.get_text(self.field_locator(field) or "")
-
-        if field == "rating":
-
-            # rating can be in text or data attribute
-            data_rating = card.get_attr("[data-rating]", "data-rating")
-            if data_rating:
-                return data_rating
-            return card.get_text(self.field_locator(field) or "")
-
-        if field == "reviews":
-            data_reviews = card.get_attr("[data-reviews]", "data-reviews")
-            if data_reviews:
-                return data_reviews
-            return card.get_text(self.field_locator(field) or "")
+        handler = self._extract_dispatch.get(field)
+        if handler is not None:
+            return handler(card)
 
         loc = self.field_locator(field)
         return card.get_text(loc) if loc else None
 
+    def _extract_website(self, card: Card) -> Optional[str]:
+        # Prefer explicit website link, then any absolute http link.
+        return card.get_attr("a.website[href]", "href") or card.get_attr("a[href^='http']", "href")
+
+    def _extract_phone(self, card: Card) -> Optional[str]:
+        tel = card.get_attr("a[href^='tel:']", "href")
+        if tel:
+            return tel.replace("tel:", "").strip()
+        return card.get_text(self._FIELD_MAP["phone"])
+
+    def _extract_rating(self, card: Card) -> Optional[str]:
+        # rating can be in text or data attribute
+        data_rating = card.get_attr("[data-rating]", "data-rating")
+        if data_rating:
+            return data_rating
+        return card.get_text(self._FIELD_MAP["rating"])
+
+    def _extract_reviews(self, card: Card) -> Optional[str]:
+        data_reviews = card.get_attr("[data-reviews]", "data-reviews")
+        if data_reviews:
+            return data_reviews
+        return card.get_text(self._FIELD_MAP["reviews"])
+
     def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec]:
         """Extract the next page request from the current page."""
         next_url = find_next_url(page.raw, base_url=page.url)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Optional
-from urllib.parse import urljoin
 
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card
+from scraper_framework.parse.html_utils import join_url
 
 
 class DynamicExampleAdapter(SiteAdapter):
@@ -16,6 +17,16 @@ class DynamicExampleAdapter(SiteAdapter):
     This adapter demonstrates mode='DYNAMIC' with wait_selector and wait_time.
     """
 
+    _FIELD_MAP = MappingProxyType(
+        {
+            "name": ".product-title, .product-name, [data-name]",
+            "price": ".product-price, .price, [data-price]",
+            "description": ".product-desc, .description, [data-description]",
+            "url": "a.product-link[href], a[data-product-url]",
+            "image": "img.product-image, img[data-src]",
+        }
+    )
+
     def key(self) -> str:
         """Return the adapter key."""
         return "dynamic_example"
@@ -31,25 +42,18 @@ class DynamicExampleAdapter(SiteAdapter):
 
     def field_locator(self, field: str) -> Optional[str]:
         """Return CSS selector for a field."""
-        mapping = {
-            "name": ".product-title, .product-name, [data-name]",
-            "price": ".product-price, .price, [data-price]",
-            "description": ".product-desc, .description, [data-description]",
-            "url": "a.product-link[href], a[data-product-url]",
-            "image": "img.product-image, img[data-src]",
-        }
-        return mapping.get(field)
+        return self._FIELD_MAP.get(field)
 
     def extract_source_url(self, card: Card, page: Page) -> Optional[str]:
         """Extract the source URL from a card."""
         # Try data attribute first, then href
         href = card.get_attr("[data-product-url]", "data-product-url")
         if href:
-            return urljoin(page.url, href)
+            return join_url(page.url, href)
 
         href = card.get_attr("a[href]", "href")
         if href:
-            return urljoin(page.url, href)
+            return join_url(page.url, href)
 
         return None
 
@@ -58,7 +62,7 @@ class DynamicExampleAdapter(SiteAdapter):
         if field == "image":
             # Prefer data-src (lazy-load), fallback to src
             src = card.get_attr("img", "data-src") or card.get_attr("img", "src")
-            return urljoin(page.url, src) if src else None
+            return join_url(page.url, src) if src else None
 
         if field == "price":
             # Extract and clean price
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Optional
-from urllib.parse import urljoin
 
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card
+from scraper_framework.parse.html_utils import join_url
 from scraper_framework.utils.logging import get_logger
 
 
@@ -17,6 +18,15 @@ class DynamicTestAdapter(SiteAdapter):
     This adapter demonstrates mode='DYNAMIC' with wait_selector and wait_time.
     """
 
+    _FIELD_MAP = MappingProxyType(
+        {
+            "Home_team": "div.ss div.ts div.vs",
+            "Away_team": "div.ss div.us div.vs",
+            "Home_score": "div.As",
+            "Away_score": "div.Bs",
+        }
+    )
+
     def __init__(self):
         self.log = get_logger("scraper_framework.adapters.dynamic_test")
 
@@ -35,27 +45,20 @@ class DynamicTestAdapter(SiteAdapter):
 
     def field_locator(self, field: str) -> Optional[str]:
         """Return CSS selector for a field."""
-        mapping = {
-            "Home_team": "div.ss div.ts div.vs",
-            "Away_team": "div.ss div.us div.vs",
-            "Home_score": "div.As",
-            "Away_score": "div.Bs",
-        }
-        return mapping.get(field)
+        return self._FIELD_MAP.get(field)
 
     def extract_source_url(self, card: Card, page: Page) -> Optional[str]:
         """Extract the source URL from a card."""
         # Because the card element IS the <a>, read href from the element itself
-        raw = card.raw()  # BeautifulSoup element
-        href = raw.get("href")  # <-- key change
-        return urljoin(page.url, href) if href else None
+        href = card.get_attr("", "href")
+        return join_url(page.url, href) if href else None
 
     def extract_field(self, card: Card, field: str, page: Page) -> Any:
         """Extract a field value from a card."""
         if field == "image":
             # Prefer data-src (lazy-load), fallback to src
             src = card.get_attr("img", "data-src") or card.get_attr("img", "src")
-            return urljoin(page.url, src) if src else None
+            return join_url(page.url, src) if src else None
 
         if field == "price":
             # Extract and clean price
@@ -76,7 +79,7 @@ class DynamicTestAdapter(SiteAdapter):
         - cursor >= scroll_max_pages
         - unique_seen_total did not increase for scroll_stall_limit cycles
         """
-        params = dict(current.params or {})
+        params = current.params or {}
 
         max_scroll_pages = int(params.get("scroll_max_pages", 25))
         cursor = int(params.get("scroll_cursor", 0))
@@ -89,28 +92,23 @@ class DynamicTestAdapter(SiteAdapter):
             self.log.info("Scroll stop: reached scroll_max_pages=%d", max_scroll_pages)
             return None
 
-        # Extract unique hrefs matching our card pattern.
-        # We count unique per DOM snapshot, and also accumulate across cycles.
-        cards = getattr(page, "_cards_cache", [])
-        hrefs = set()
-
-        for c in cards:
-            u = self.extract_source_url(c, page)
-            if u:
-                hrefs.add(u)
-
-        unique_in_dom = len(hrefs)
-
-        # Accumulate total uniques across cycles in params
-        seen_total = set(params.get("scroll_seen_hrefs", []))
-        before_total = len(seen_total)
-        seen_total.update(hrefs)
+        # Accumulate unique hrefs across cycles in params.
+        # Kept as a set across cycles; only checkpoints serialize it to a list.
+        seen_total = params.get("scroll_seen_hrefs")
+        if not isinstance(seen_total, set):
+            seen_total = set(seen_total or [])
+
+        # Only hrefs not seen in earlier cycles are collected; already-seen ones are skipped.
+        cards = page.cards
+        new_hrefs = {u for c in cards if (u := self.extract_source_url(c, page)) and u not in seen_total}
+        # A new set: the current spec's one must stay as it was (with_params is copy-on-write).
+        seen_total = seen_total | new_hrefs
         after_total = len(seen_total)
+        # Card elements currently in the DOM; the scroll step waits for this count to rise.
+        cards_in_dom = len(cards)
 
         # Did we discover NEW unique cards this cycle?
-        grew = after_total > int(params.get("scroll_unique_total", 0))
-
-        if not grew:
+        if not new_hrefs:
             stall += 1
         else:
             stall = 0
@@ -118,11 +116,11 @@ class DynamicTestAdapter(SiteAdapter):
         # Stop if stalled
         if stall >= stall_limit:
             self.log.info(
-                "Scroll stop: cursor=%d unique_total=%d (+%d) dom_unique=%d stall=%d/%d",
+                "Scroll stop: cursor=%d unique_total=%d (+%d) dom_cards=%d stall=%d/%d",
                 cursor,
                 after_total,
-                after_total - before_total,
-                unique_in_dom,
+                len(new_hrefs),
+                cards_in_dom,
                 stall,
                 stall_limit,
             )
@@ -130,34 +128,24 @@ class DynamicTestAdapter(SiteAdapter):
 
         # Log progress (nice for debugging)
         self.log.info(
-            "Scroll progress: cursor=%d unique_total=%d (+%d) dom_unique=%d stall=%d/%d",
+            "Scroll progress: cursor=%d unique_total=%d (+%d) dom_cards=%d stall=%d/%d",
             cursor,
             after_total,
-            after_total - before_total,
-            unique_in_dom,
+            len(new_hrefs),
+            cards_in_dom,
             stall,
             stall_limit,
         )
 
         # Build next RequestSpec: ONE scroll action
-        params.update(
-            {
-                "scroll_action": "down",
-                "scroll_cursor": cursor + 1,
-                # store accumulated progress
-                "scroll_stall_count": stall,
-                "scroll_unique_total": after_total,
-                "scroll_seen_hrefs": list(seen_total),
-                # optional: ScrollStep can wait for DOM to show more items (best-effort)
-                "scroll_wait_increase_selector": self.card_locator(),
-                "scroll_prev_count": unique_in_dom,  # DOM count (not the progress metric)
-            }
-        )
-
-        return RequestSpec(
-            url=current.url,
-            headers=current.headers,
-            params=params,
-            method="GET",
-            body=None,
+        return current.with_params(
+            scroll_action="down",
+            scroll_cursor=cursor + 1,
+            # store accumulated progress
+            scroll_stall_count=stall,
+            scroll_unique_total=after_total,
+            scroll_seen_hrefs=seen_total,
+            # optional: ScrollStep can wait for DOM to show more items (best-effort)
+            scroll_wait_increase_selector=self.card_locator(),
+            scroll_prev_count=cards_in_dom,  # DOM count (not the progress metric)
         )
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import re
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
 
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card
 
+_NEXT_RE = re.compile(r'<a class="next page-numbers" href="([^"]+)"')
+
 
 class ScrapeStatic(SiteAdapter):
     """Adapter for scraping for testing."""
 
+    _FIELD_MAP = MappingProxyType(
+        {
+            "name": "p.p_class",
+            "address": "p.address",
+            "phone": "p.phone",
+        }
+    )
+
     def key(self) -> str:
         """Return the adapter key."""
         return "test_static"
@@ -22,14 +34,13 @@ class ScrapeStatic(SiteAdapter):
         """Return CSS selector for card elements."""
         return "div.row_arc"
 
+    def card_locator_tag(self) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the (tag, class) hint used to parse only card subtrees."""
+        return ("div", "row_arc")
+
     def field_locator(self, field: str) -> Optional[str]:
         """Return CSS selector for a field."""
-        mapping = {
-            "name": "p.p_class",
-            "address": "p.address",
-            "phone": "p.phone",
-        }
-        return mapping.get(field)
+        return self._FIELD_MAP.get(field)
 
     def extract_source_url(self, card: Card, page: Page) -> Optional[str]:
         """Extract the source URL from a card."""
@@ -43,14 +54,9 @@ class ScrapeStatic(SiteAdapter):
 
     def next_request(self, page: Page, current: RequestSpec) -> Optional[RequestSpec]:
         """Extract the next page request from the current page."""
-        # We'll parse via naive string search to keep adapter independent of BeautifulSoup.
-        # (Later we can add a helper for next link extraction.)
-        html = page.raw
-        marker = '<a class="next page-numbers" href="'
-        i = html.find(marker)
-        if i == -1:
+        # Single regex scan keeps the adapter independent of BeautifulSoup.
+        m = _NEXT_RE.search(page.raw)
+        if not m:
             return None
-        j = html.find('"', i + len(marker))
-        href = html[i + len(marker) : j]
-        next_url = href
+        next_url = m.group(1)
         return RequestSpec(url=next_url, headers=current.headers, params=current.params, method="GET", body=None)
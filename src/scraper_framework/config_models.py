@@ -5,11 +5,12 @@ Provides schema validation with clear error messages for job configurations.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, Union
+import copy
+import hashlib
+import os
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
 
-import yaml
-from apscheduler.triggers.cron import CronTrigger
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, ValidationError, field_validator, model_validator
 
 from scraper_framework.core.models import DedupeMode as CoreDedupeMode
 from scraper_framework.core.models import EnrichConfig as CoreEnrichConfig
@@ -21,14 +22,26 @@ from scraper_framework.core.models import (
     ScrapeJob,
 )
 
+_DEFAULT_REQUIRED_FIELDS = ("name", "source_url")
 
-class JobConfig(BaseModel):
+
+class _ConfigModel(BaseModel):
+    """Base for config sections: immutable once validated, and unknown keys are rejected."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class JobConfig(_ConfigModel):
     """Configuration for a scraping job."""
 
     id: str = Field(..., description="Unique identifier for the job")
     name: str = Field(..., description="Human-readable name for the job")
     adapter: str = Field(..., description="Adapter key to use for this job")
-    start_url: str = Field(..., description="Initial URL to start scraping from")
+    start_url: str = Field(
+        ...,
+        pattern=r"^https?://",
+        description="Initial URL to start scraping from (must be an HTTP/HTTPS URL)",
+    )
     method: str = Field("GET", description="HTTP method to use")
     headers: Dict[str, str] = Field(default_factory=dict, description="HTTP headers")
     params: Dict[str, Any] = Field(default_factory=dict, description="URL query parameters")
@@ -43,38 +56,43 @@ class JobConfig(BaseModel):
         le=100000,
         description="Chunk size used when execution_mode is stream",
     )
+    sink_flush_records: Optional[int] = Field(
+        None,
+        ge=1,
+        le=1000000,
+        description="In stream mode, collect emitted records across chunks and write once this many are pending",
+    )
     max_pages: int = Field(5, ge=1, le=1000, description="Maximum number of pages to scrape")
     delay_ms: int = Field(800, ge=0, le=60000, description="Delay between requests in milliseconds")
+    prefetch_next_page: bool = Field(
+        False,
+        description="Fetch the next page in the background while the current page is processed (not for Playwright)",
+    )
     dedupe_mode: CoreDedupeMode = Field(CoreDedupeMode.BY_SOURCE_URL, description="Deduplication strategy")
     dynamic_engine: Literal["selenium", "playwright"] = Field(
         "selenium",
         description="Browser engine for DYNAMIC adapters",
     )
     required_fields: List[str] = Field(
-        default_factory=lambda: ["name", "source_url"], description="Fields that must be present in scraped records"
+        default_factory=lambda: list(_DEFAULT_REQUIRED_FIELDS),
+        description="Fields that must be present in scraped records",
     )
     field_schema: List[str] = Field(default_factory=list, description="Expected fields in records")
 
-    @field_validator("start_url")
-    @classmethod
-    def validate_start_url(cls, v):
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("start_url must be a valid HTTP/HTTPS URL")
-        return v
-
     @field_validator("required_fields")
     @classmethod
     def validate_required_fields(cls, v):
         if not v:
             raise ValueError("required_fields cannot be empty")
-        return list(set(v))  # Remove duplicates
+        return list(dict.fromkeys(v))  # Remove duplicates, keeping declaration order
 
 
-class EnrichConfig(BaseModel):
+class EnrichConfig(_ConfigModel):
     """Configuration for enrichment features."""
 
     enabled: bool = Field(False, description="Whether to enable enrichment")
     fields: List[str] = Field(default_factory=list, description="Fields to enrich")
+    workers: int = Field(1, ge=1, le=32, description="Detail pages fetched concurrently per listing page")
 
     @model_validator(mode="after")
     def validate_enrich_config(self):
@@ -83,7 +101,7 @@ class EnrichConfig(BaseModel):
         return self
 
 
-class ProcessingStageConfig(BaseModel):
+class ProcessingStageConfig(_ConfigModel):
     """Configuration for a single post-processing stage."""
 
     plugin: str = Field(..., description="Registered processing plugin name")
@@ -105,21 +123,13 @@ class ProcessingStageConfig(BaseModel):
         return str(v).strip()
 
 
-class ProcessingConfig(BaseModel):
+class ProcessingConfig(_ConfigModel):
     """Configuration for the processing pipeline."""
 
     enabled: bool = Field(False, description="Whether post-processing pipeline is enabled")
-    schema_version: str = Field("1.0", description="Processing schema version between stages")
+    schema_version: Literal["1.0"] = Field("1.0", description="Processing schema version between stages")
     stages: List[ProcessingStageConfig] = Field(default_factory=list, description="Ordered processing stages")
 
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v):
-        allowed = {"1.0"}
-        if v not in allowed:
-            raise ValueError(f"processing.schema_version must be one of: {sorted(allowed)}")
-        return v
-
     @model_validator(mode="after")
     def validate_enabled_stages(self):
         if self.enabled and not self.stages:
@@ -127,7 +137,7 @@ class ProcessingConfig(BaseModel):
         return self
 
 
-class CsvSinkConfig(BaseModel):
+class CsvSinkConfig(_ConfigModel):
     """Configuration for CSV sink."""
 
     type: Literal["csv"]
@@ -138,23 +148,16 @@ class CsvSinkConfig(BaseModel):
     )
 
 
-class GoogleSheetsSinkConfig(BaseModel):
+class GoogleSheetsSinkConfig(_ConfigModel):
     """Configuration for Google Sheets sink."""
 
     type: Literal["google_sheets"]
     sheet_id: str = Field(..., description="Google Sheets ID")
     tab: str = Field(..., description="Sheet tab name")
     credentials_path: str = Field("service_account.json", description="Path to service account credentials")
-    mode: str = Field("append", description="Write mode: append, replace, or upsert")
+    mode: Literal["append", "replace", "upsert"] = Field("append", description="Write mode: append, replace, or upsert")
     key_field: Optional[str] = Field(None, description="Field to use as key for upsert operations")
 
-    @field_validator("mode")
-    @classmethod
-    def validate_mode(cls, v):
-        if v not in ["append", "replace", "upsert"]:
-            raise ValueError("mode must be one of: append, replace, upsert")
-        return v
-
     @model_validator(mode="after")
     def validate_upsert_config(self):
         if self.mode == "upsert" and not self.key_field:
@@ -162,7 +165,7 @@ class GoogleSheetsSinkConfig(BaseModel):
         return self
 
 
-class JsonlSinkConfig(BaseModel):
+class JsonlSinkConfig(_ConfigModel):
     """Configuration for JSONL sink."""
 
     type: Literal["jsonl"]
@@ -173,7 +176,7 @@ class JsonlSinkConfig(BaseModel):
     )
 
 
-class ScheduleConfig(BaseModel):
+class ScheduleConfig(_ConfigModel):
     """Configuration for scheduled execution."""
 
     enabled: bool = Field(False, description="Whether scheduling is enabled")
@@ -205,6 +208,20 @@ class ScheduleConfig(BaseModel):
             raise ValueError("timezone cannot be empty")
         return tz
 
+    @model_validator(mode="before")
+    @classmethod
+    def default_schedule_interval(cls, data: Any) -> Any:
+        # Backward-compatible default for enabled schedules. Applied to the raw input
+        # because validated configs are frozen.
+        if (
+            isinstance(data, dict)
+            and data.get("enabled")
+            and data.get("interval_hours") is None
+            and not str(data.get("cron") or "").strip()
+        ):
+            return {**data, "interval_hours": 24}
+        return data
+
     @model_validator(mode="after")
     def validate_schedule_config(self):
         if not self.enabled:
@@ -216,12 +233,10 @@ class ScheduleConfig(BaseModel):
         if has_interval and has_cron:
             raise ValueError('Set either schedule.interval_hours or schedule.cron, not both')
 
-        if not has_interval and not has_cron:
-            # Backward-compatible default for enabled schedules.
-            self.interval_hours = 24
-            return self
-
         if has_cron:
+            # Imported here: only cron schedules need APScheduler at validation time.
+            from apscheduler.triggers.cron import CronTrigger
+
             try:
                 CronTrigger.from_crontab(self.cron or "", timezone=self.timezone)
             except Exception as exc:
@@ -232,7 +247,7 @@ class ScheduleConfig(BaseModel):
         return self
 
 
-class IncrementalConfigModel(BaseModel):
+class IncrementalConfigModel(_ConfigModel):
     """Configuration for incremental caching and resume behavior."""
 
     enabled: bool = Field(False, description="Whether incremental mode is enabled")
@@ -257,79 +272,72 @@ class IncrementalConfigModel(BaseModel):
     )
 
 
-SinkConfig = Union[CsvSinkConfig, GoogleSheetsSinkConfig, JsonlSinkConfig]
+def _sink_type(value: Any) -> Any:
+    """Read the sink discriminator from raw input or an already-built sink model."""
+    if isinstance(value, dict):
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+# Tagged union: pydantic picks the sink model from "type" in a single validation pass.
+SinkConfig = Annotated[
+    Union[
+        Annotated[CsvSinkConfig, Tag("csv")],
+        Annotated[GoogleSheetsSinkConfig, Tag("google_sheets")],
+        Annotated[JsonlSinkConfig, Tag("jsonl")],
+    ],
+    Discriminator(
+        _sink_type,
+        custom_error_type="unknown_sink_type",
+        custom_error_message='Unknown sink type. Must be "csv" , "google_sheets" or "jsonl"',
+    ),
+]
+
+
+# Shared defaults for omitted sections. Configs are frozen, so every ScraperConfig
+# can point at the same instance instead of building a fresh one. They are handed
+# out by default_factory because pydantic deep-copies unhashable plain defaults.
+_DEFAULT_ENRICH = EnrichConfig(enabled=False, fields=[], workers=1)
+_DEFAULT_PROCESSING = ProcessingConfig(enabled=False, schema_version="1.0", stages=[])
+_DEFAULT_SCHEDULE = ScheduleConfig(enabled=False, interval_hours=24, cron=None, timezone="UTC")
+_DEFAULT_INCREMENTAL = IncrementalConfigModel(
+    enabled=False,
+    backend="sqlite",
+    state_path="output/state.db",
+    mode="changed_only",
+    resume=True,
+    checkpoint_every_pages=1,
+    full_refresh_every_runs=None,
+)
 
 
-class ScraperConfig(BaseModel):
+class ScraperConfig(_ConfigModel):
     """Root configuration model for scraper jobs."""
 
     job: JobConfig
-    sink: SinkConfig | Dict[str, Any] = Field(..., description="Sink configuration")
-    enrich: EnrichConfig = Field(default_factory=lambda: EnrichConfig(enabled=False, fields=[]))
-    processing: ProcessingConfig = Field(
-        default_factory=lambda: ProcessingConfig(enabled=False, schema_version="1.0", stages=[])
-    )
-    schedule: ScheduleConfig = Field(
-        default_factory=lambda: ScheduleConfig(enabled=False, interval_hours=24, cron=None, timezone="UTC")
-    )
-    incremental: IncrementalConfigModel = Field(
-        default_factory=lambda: IncrementalConfigModel(
-            enabled=False,
-            backend="sqlite",
-            state_path="output/state.db",
-            mode="changed_only",
-            resume=True,
-            checkpoint_every_pages=1,
-            full_refresh_every_runs=None,
-        )
-    )
-
-    @model_validator(mode="after")
-    def validate_sink_config(self):
-        """Validate and convert sink configuration."""
-        if isinstance(self.sink, (CsvSinkConfig, GoogleSheetsSinkConfig, JsonlSinkConfig)):
-            return self
-
-        sink_data = self.sink
-        sink_type = sink_data.get("type")
-
-        if sink_type == "csv":
-            # Validate CSV sink
-            if "path" not in sink_data:
-                raise ValueError('CSV sink requires "path" field')
-            # Create and assign the validated model
-            self.sink = CsvSinkConfig(**sink_data)
-        elif sink_type == "google_sheets":
-            # Validate Google Sheets sink
-            required_fields = ["sheet_id"]
-            missing = [f for f in required_fields if f not in sink_data]
-            if missing:
-                raise ValueError(f"Google Sheets sink missing required fields: {missing}")
-            # Create and assign the validated model
-            self.sink = GoogleSheetsSinkConfig(**sink_data)
-        elif sink_type == "jsonl":
-            # Validate JSONL sink
-            if "path" not in sink_data:
-                raise ValueError('JSONL sink requires "path" field')
-            # Create and assign the validated model
-            self.sink = JsonlSinkConfig(**sink_data)
-        else:
-            raise ValueError(f'Unknown sink type: {sink_type}. Must be "csv" , "google_sheets" or "jsonl"')
-
-        return self
+    sink: SinkConfig = Field(..., description="Sink configuration")
+    enrich: EnrichConfig = Field(default_factory=lambda: _DEFAULT_ENRICH)
+    processing: ProcessingConfig = Field(default_factory=lambda: _DEFAULT_PROCESSING)
+    schedule: ScheduleConfig = Field(default_factory=lambda: _DEFAULT_SCHEDULE)
+    incremental: IncrementalConfigModel = Field(default_factory=lambda: _DEFAULT_INCREMENTAL)
 
     @model_validator(mode="after")
     def validate_config_consistency(self):
         """Validate that configuration components are consistent."""
         # Check that enrich fields are in the field schema
-        if self.enrich.enabled:
-            missing_fields = set(self.enrich.fields) - set(self.job.field_schema)
-            if missing_fields:
+        if self.enrich.enabled and self.enrich.fields:
+            schema_fields = frozenset(self.job.field_schema)
+            if not schema_fields.issuperset(self.enrich.fields):
+                missing_fields = tuple(f for f in self.enrich.fields if f not in schema_fields)
                 raise ValueError(f"Enrich fields {missing_fields} must be declared in job.field_schema")
 
         return self
 
 
+# Validated configs keyed by absolute path -> (content digest, config).
+_CONFIG_CACHE: Dict[str, Tuple[bytes, ScraperConfig]] = {}
+
+
 def load_and_validate_config(config_path: str) -> ScraperConfig:
     """
     Load and validate a scraper configuration from YAML file.
@@ -338,7 +346,9 @@ def load_and_validate_config(config_path: str) -> ScraperConfig:
         config_path: Path to the YAML configuration file
 
     Returns:
-        Validated ScraperConfig object
+        Validated ScraperConfig object. Loading an unchanged file again returns
+        the cached instance; its nested dicts (params, headers, ...) are shared too,
+        so callers must copy them before mutating (see config_to_job_objects).
 
     Raises:
         ValidationError: If configuration is invalid
@@ -346,25 +356,38 @@ def load_and_validate_config(config_path: str) -> ScraperConfig:
         yaml.YAMLError: If YAML is malformed
     """
 
+    import yaml
+
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            data = f.read()
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    # Unchanged file: reuse the previously validated config.
+    cache_key = os.path.abspath(config_path)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    # libyaml-backed loader; falls back to the pure-Python parser when PyYAML was built without it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    try:
+        raw_config = yaml.load(data, Loader=loader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {config_path}: {e}")
 
     try:
-        config = ScraperConfig(**raw_config)
+        # model_validate goes straight to the class's prebuilt SchemaValidator.
+        config = ScraperConfig.model_validate(raw_config)
+        _CONFIG_CACHE[cache_key] = (digest, config)
         return config
     except ValidationError as e:
         # Format validation errors nicely
-        error_messages = []
-        for error in e.errors():
-            field_path = ".".join(str(loc) for loc in error["loc"])
-            error_messages.append(f"  {field_path}: {error['msg']}")
-
-        raise ValueError(f"Configuration validation failed for {config_path}:\n" + "\n".join(error_messages)) from e
+        msg = "\n".join(f"  {'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+        raise ValueError(f"Configuration validation failed for {config_path}:\n{msg}") from e
 
 
 def config_to_job_objects(config: ScraperConfig) -> tuple:
@@ -375,18 +398,20 @@ def config_to_job_objects(config: ScraperConfig) -> tuple:
         Tuple of (ScrapeJob, adapter_key, schedule_config_dict)
     """
 
-    # Convert job config
+    # Convert job config. Copies: the config may be cached and reused, while clients
+    # record per-run state (e.g. _cookies_handled) in the request's params.
     start = RequestSpec(
         url=config.job.start_url,
         method=config.job.method,
-        headers=config.job.headers,
-        params=config.job.params,
-        body=config.job.body,
+        headers=dict(config.job.headers),
+        params=copy.deepcopy(config.job.params),
+        body=copy.deepcopy(config.job.body),
     )
 
     enrich = CoreEnrichConfig(
         enabled=config.enrich.enabled,
         fields=set(config.enrich.fields),
+        workers=config.enrich.workers,
     )
 
     processing = CoreProcessingConfig(
@@ -419,8 +444,10 @@ def config_to_job_objects(config: ScraperConfig) -> tuple:
         start=start,
         execution_mode=config.job.execution_mode,
         batch_size=config.job.batch_size,
+        sink_flush_records=config.job.sink_flush_records,
         max_pages=config.job.max_pages,
         delay_ms=config.job.delay_ms,
+        prefetch_next_page=config.job.prefetch_next_page,
         required_fields=set(config.job.required_fields),
         dedupe_mode=config.job.dedupe_mode,
         field_schema=list(config.job.field_schema),
@@ -428,11 +455,7 @@ def config_to_job_objects(config: ScraperConfig) -> tuple:
         enrich=enrich,
         processing=processing,
         incremental=incremental,
-        sink_config=(
-            config.sink.model_dump()
-            if isinstance(config.sink, (CsvSinkConfig, GoogleSheetsSinkConfig, JsonlSinkConfig))
-            else dict(config.sink)
-        ),
+        sink_config=config.sink.model_dump(),
     )
 
     adapter_key = config.job.adapter
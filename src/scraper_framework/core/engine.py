@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set
 
 from scraper_framework.adapters.base import SiteAdapter
@@ -11,10 +12,11 @@ from scraper_framework.parse.parsers import PageParser
 from scraper_framework.process.runner import ProcessingRunner
 from scraper_framework.sinks.base import Sink
 from scraper_framework.state.base import IncrementalStateStore
+from scraper_framework.state.checkpoint_writer import BackgroundCheckpointWriter
 from scraper_framework.transform.dedupe import DedupeStrategy
 from scraper_framework.transform.normalizers import Normalizer
 from scraper_framework.transform.validators import Validator
-from scraper_framework.utils.hashing import normalize_text, stable_hash
+from scraper_framework.utils.hashing import normalize_text, normalized_hash, stable_hash
 from scraper_framework.utils.logging import get_logger
 from scraper_framework.utils.time import utc_now_iso
 
@@ -62,6 +64,10 @@ class ScrapeEngine:
         self.processor_runner = processor_runner
         self.state_store = state_store
         self.log = get_logger("scraper_framework.engine")
+        # Created on first use when job.enrich.workers > 1; shut down at the end of each run.
+        self._enrich_pool: Optional[ThreadPoolExecutor] = None
+        # Cards dropped by _prefilter_records as cross-chunk duplicates since the last chunk summary.
+        self._prefiltered_duplicates = 0
 
     def run(self, job: ScrapeJob) -> ScrapeReport:
         """
@@ -74,8 +80,10 @@ class ScrapeEngine:
             A report summarizing the scraping results.
         """
         report = ScrapeReport()
+        self._prefiltered_duplicates = 0
         records: List[Record] = []
         stream_buffer: List[Record] = []
+        sink_buffer: List[Record] = []
         seen_dedupe_keys: Set[str] = set()
         chunks_flushed = 0
         execution_mode, stream_mode, batch_size = self._resolve_execution(job)
@@ -86,9 +94,14 @@ class ScrapeEngine:
         successful = False
         current: Optional[RequestSpec] = job.start
         pages = 0
+        prefetcher: Optional[ThreadPoolExecutor] = None
+        prefetched: Optional[Future] = None
+        checkpoint_writer: Optional[BackgroundCheckpointWriter] = None
 
         try:
             limiter = RateLimiter(job.delay_ms)
+            if self._prefetch_enabled(job):
+                prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
 
             if incremental_enabled:
                 run_count = self.state_store.mark_run_started(job.id)
@@ -99,6 +112,7 @@ class ScrapeEngine:
                         current = resumed_request
                         pages = resumed_pages
                         self.log.info("Resuming from checkpoint: pages=%s url=%s", pages, resumed_request.url)
+                    checkpoint_writer = self._start_checkpoint_writer()
 
             self.log.info(
                 "Job started: %s (%s) mode=%s batch_size=%s incremental=%s run_count=%s full_refresh=%s",
@@ -112,7 +126,11 @@ class ScrapeEngine:
             )
 
             while current and pages < job.max_pages:
-                page, cards = self._fetch_and_parse_page(current, report, pages + 1)
+                page = self._next_page(prefetched, current, pages + 1)
+                cards = self._parse_page(page, report)
+                next_request = self.parser.next_request(page, self.adapter, current)
+                prefetched = self._schedule_prefetch(prefetcher, job, next_request, pages, limiter)
+
                 chunks_flushed = self._collect_page_records(
                     cards=cards,
                     page=page,
@@ -120,6 +138,7 @@ class ScrapeEngine:
                     report=report,
                     stream_mode=stream_mode,
                     stream_buffer=stream_buffer,
+                    sink_buffer=sink_buffer,
                     batch_size=batch_size,
                     seen_dedupe_keys=seen_dedupe_keys,
                     records=records,
@@ -127,25 +146,18 @@ class ScrapeEngine:
                     force_full_refresh=force_full_refresh,
                 )
 
-                current = self.parser.next_request(page, self.adapter, current)
+                current = next_request
                 pages += 1
 
-                if incremental_enabled and incremental_cfg.resume:
-                    checkpoint_every = max(1, int(getattr(incremental_cfg, "checkpoint_every_pages", 1) or 1))
-                    if pages % checkpoint_every == 0:
-                        self.state_store.save_checkpoint(
-                            job.id,
-                            self._request_to_payload(current),
-                            pages,
-                            status="in_progress",
-                        )
-
-                limiter.sleep()
+                self._submit_checkpoint(checkpoint_writer, job, current, pages)
+                if prefetched is None:
+                    limiter.sleep()
 
             chunks_flushed = self._finalize_run(
                 job=job,
                 stream_mode=stream_mode,
                 stream_buffer=stream_buffer,
+                sink_buffer=sink_buffer,
                 seen_dedupe_keys=seen_dedupe_keys,
                 report=report,
                 records=records,
@@ -166,6 +178,11 @@ class ScrapeEngine:
             )
             successful = True
         finally:
+            if not successful:
+                # Their keys are already recorded in the state store; a later run would skip them as unchanged.
+                self._write_pending_on_failure(job, sink_buffer, report)
+            self._stop_workers(prefetcher, checkpoint_writer)
+
             if incremental_enabled:
                 try:
                     if successful:
@@ -195,14 +212,81 @@ class ScrapeEngine:
         batch_size = max(1, int(getattr(job, "batch_size", 500)))
         return execution_mode, stream_mode, batch_size
 
-    def _fetch_and_parse_page(self, current: RequestSpec, report: ScrapeReport, page_index: int) -> tuple[Page, List[Any]]:
+    def _prefetch_enabled(self, job: ScrapeJob) -> bool:
+        if not getattr(job, "prefetch_next_page", False):
+            return False
+        if self._is_dynamic_adapter():
+            # A Selenium driver can be handed to the prefetch thread as long as nothing else drives the browser
+            # meanwhile (detail-page enrichment shares the fetcher); the Playwright sync API never leaves its thread.
+            dynamic_engine = str(getattr(job, "dynamic_engine", "selenium") or "selenium").strip().lower()
+            if dynamic_engine != "selenium" or self.enricher is not None:
+                self.log.info("prefetch_next_page ignored for DYNAMIC adapters (playwright or enrichment enabled)")
+                return False
+        return True
+
+    def _next_page(self, prefetched: Optional[Future], current: RequestSpec, page_index: int) -> Page:
+        if prefetched is not None:
+            return prefetched.result()
+        return self._fetch_page(current, page_index)
+
+    def _schedule_prefetch(
+        self,
+        prefetcher: Optional[ThreadPoolExecutor],
+        job: ScrapeJob,
+        next_request: Optional[RequestSpec],
+        pages: int,
+        limiter: RateLimiter,
+    ) -> Optional[Future]:
+        """Overlap the next page's delay + download with record processing for the current one."""
+        if prefetcher is None or not next_request or pages + 1 >= job.max_pages:
+            return None
+        return prefetcher.submit(self._fetch_page, next_request, pages + 2, limiter)
+
+    def _submit_checkpoint(
+        self,
+        checkpoint_writer: Optional[BackgroundCheckpointWriter],
+        job: ScrapeJob,
+        current: Optional[RequestSpec],
+        pages: int,
+    ) -> None:
+        if checkpoint_writer is None:
+            return
+        checkpoint_every = max(1, int(getattr(getattr(job, "incremental", None), "checkpoint_every_pages", 1) or 1))
+        if pages % checkpoint_every == 0:
+            # Written off the page loop; a newer checkpoint replaces one still pending.
+            checkpoint_writer.submit(job.id, self._request_to_payload(current), pages)
+
+    def _stop_workers(
+        self,
+        prefetcher: Optional[ThreadPoolExecutor],
+        checkpoint_writer: Optional[BackgroundCheckpointWriter],
+    ) -> None:
+        if prefetcher is not None:
+            prefetcher.shutdown(wait=True, cancel_futures=True)
+        if self._enrich_pool is not None:
+            self._enrich_pool.shutdown(wait=True)
+            self._enrich_pool = None
+        # Drained before run() saves/clears the final checkpoint, so a late write cannot overtake it.
+        if checkpoint_writer is not None:
+            checkpoint_writer.close()
+
+    def _is_dynamic_adapter(self) -> bool:
+        # Browser-backed clients (Selenium/Playwright) are bound to the thread that drives them.
+        return str(self.adapter.mode() or "").upper() == "DYNAMIC"
+
+    def _fetch_page(self, current: RequestSpec, page_index: int, limiter: Optional[RateLimiter] = None) -> Page:
+        # A prefetch waits out the page delay itself, so request spacing matches the sequential loop.
+        if limiter is not None:
+            limiter.sleep()
         self.log.info("Fetching page %s: %s", page_index, current.url)
-        page = self.fetcher.fetch(current)
+        return self.fetcher.fetch(current)
+
+    def _parse_page(self, page: Page, report: ScrapeReport) -> List[Any]:
         report.pages_fetched += 1
         cards = self.parser.parse_cards(page, self.adapter)
         report.cards_found += len(cards)
         self.log.info("Cards found: %s", len(cards))
-        return page, cards
+        return cards
 
     def _collect_page_records(
         self,
@@ -212,21 +296,25 @@ class ScrapeEngine:
         report: ScrapeReport,
         stream_mode: bool,
         stream_buffer: List[Record],
+        sink_buffer: List[Record],
         batch_size: int,
         seen_dedupe_keys: Set[str],
         records: List[Record],
         chunks_flushed: int,
         force_full_refresh: bool,
     ) -> int:
-        for card in cards:
-            record = self._build_valid_record(card, page, job, report)
-            if record is None:
+        extracted = [r for r in (self._extract_record(card, page, job, report) for card in cards) if r is not None]
+        extracted = self._prefilter_records(job, extracted, report, seen_dedupe_keys, force_full_refresh)
+        for record in self._enrich_records(job, extracted):
+            valid = self._validate_record(record, job, report)
+            if valid is None:
                 continue
             chunks_flushed = self._append_record(
                 job=job,
-                record=record,
+                record=valid,
                 stream_mode=stream_mode,
                 stream_buffer=stream_buffer,
+                sink_buffer=sink_buffer,
                 batch_size=batch_size,
                 seen_dedupe_keys=seen_dedupe_keys,
                 report=report,
@@ -236,16 +324,125 @@ class ScrapeEngine:
             )
         return chunks_flushed
 
-    def _build_valid_record(self, card: Any, page: Page, job: ScrapeJob, report: ScrapeReport) -> Optional[Record]:
+    def _extract_record(self, card: Any, page: Page, job: ScrapeJob, report: ScrapeReport) -> Optional[Record]:
         record = self.extract(card, page, job)
         if record is None:
             report.records_skipped += 1
             report.bump_failure("extract_failed")
-            return None
+        return record
 
-        if self.enricher and self.enricher.should_enrich(record):
-            record = self.enricher.enrich(record, self.adapter)
+    def _prefilter_records(
+        self,
+        job: ScrapeJob,
+        records: List[Record],
+        report: ScrapeReport,
+        seen_dedupe_keys: Set[str],
+        force_full_refresh: bool,
+    ) -> List[Record]:
+        """
+        Take records whose outcome is already certain out of the pipeline before they are enriched:
+        - keys already flushed by an earlier stream chunk (cross-chunk duplicates) are dropped;
+        - in new_only mode, keys already in the state store are settled by _skip_known_records.
+        """
+        check_known = self._known_prefilter_enabled(job, force_full_refresh)
+        if not records or not (seen_dedupe_keys or check_known):
+            return records
+
+        kept: List[Record] = []
+        kept_keys: List[str] = []
+        for record in records:
+            key = str(self.deduper.key(record) or "").strip()
+            if key and key in seen_dedupe_keys:
+                continue
+            kept.append(record)
+            kept_keys.append(key)
+
+        # Reported with the next chunk summary, where the chunk dedupe pass used to count them.
+        self._prefiltered_duplicates += len(records) - len(kept)
+        if not check_known or not kept or self.state_store is None:
+            return kept
+
+        state_keys = [key or str(record.source_url or "").strip() for key, record in zip(kept_keys, kept)]
+        known = self.state_store.find_known_keys(job.id, [k for k in state_keys if k])
+        if not known:
+            return kept
+
+        new_records: List[Record] = []
+        known_records: List[tuple[str, str, Record]] = []
+        for key, state_key, record in zip(kept_keys, state_keys, kept):
+            if state_key in known:
+                known_records.append((key, state_key, record))
+            else:
+                new_records.append(record)
+        self._skip_known_records(job, known_records, report, seen_dedupe_keys)
+        return new_records
 
+    def _skip_known_records(
+        self,
+        job: ScrapeJob,
+        known_records: List[tuple[str, str, Record]],
+        report: ScrapeReport,
+        seen_dedupe_keys: Set[str],
+    ) -> None:
+        """
+        Settle new_only records that already have state without enriching them. They are normalized,
+        validated, deduplicated and touched in the state store as the full pipeline would, then dropped.
+        """
+        required = set(job.required_fields)
+        if self.enricher is not None:
+            # Fields filled from detail pages cannot be checked without fetching them.
+            required -= set(getattr(getattr(job, "enrich", None), "fields", None) or ())
+
+        tracked: List[tuple[str, str]] = []
+        for key, state_key, record in known_records:
+            if key and key in seen_dedupe_keys:
+                continue
+            record = self.normalizer.normalize(record)
+            validation = self.validator.validate(record, required)
+            if not validation.ok:
+                report.records_skipped += 1
+                report.bump_failure(validation.reason)
+                continue
+            if key:
+                seen_dedupe_keys.add(key)
+            tracked.append((state_key, self._record_content_hash(record)))
+
+        if tracked and self.state_store is not None:
+            self.state_store.decide_and_touch_many(job.id, tracked, "new_only")
+            report.records_skipped_incremental += len(tracked)
+
+    def _known_prefilter_enabled(self, job: ScrapeJob, force_full_refresh: bool) -> bool:
+        if force_full_refresh or not self.state_store:
+            return False
+
+        incremental_cfg = getattr(job, "incremental", None)
+        if not incremental_cfg or not incremental_cfg.enabled:
+            return False
+        if str(getattr(incremental_cfg, "mode", "") or "").strip().lower() != "new_only":
+            return False
+        # Processing stages may rewrite the fields a key is derived from.
+        return not (self.processor_runner and getattr(job, "processing", None) and job.processing.enabled)
+
+    def _enrich_records(self, job: ScrapeJob, records: List[Record]) -> List[Record]:
+        """Enrich a page's records, fetching detail pages concurrently when enrich.workers > 1."""
+        if not self.enricher or not records:
+            return records
+
+        workers = max(1, int(getattr(getattr(job, "enrich", None), "workers", 1) or 1))
+        if workers == 1 or len(records) == 1 or self._is_dynamic_adapter():
+            return [self._enrich_record(record) for record in records]
+
+        if self._enrich_pool is None:
+            self._enrich_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich")
+        # map() keeps card order, so downstream dedupe still keeps the first occurrence.
+        return list(self._enrich_pool.map(self._enrich_record, records))
+
+    def _enrich_record(self, record: Record) -> Record:
+        if self.enricher.should_enrich(record):
+            return self.enricher.enrich(record, self.adapter)
+        return record
+
+    def _validate_record(self, record: Record, job: ScrapeJob, report: ScrapeReport) -> Optional[Record]:
         record = self.normalizer.normalize(record)
         validation = self.validator.validate(record, job.required_fields)
         if not validation.ok:
@@ -260,6 +457,7 @@ class ScrapeEngine:
         record: Record,
         stream_mode: bool,
         stream_buffer: List[Record],
+        sink_buffer: List[Record],
         batch_size: int,
         seen_dedupe_keys: Set[str],
         report: ScrapeReport,
@@ -279,6 +477,7 @@ class ScrapeEngine:
         self._flush_stream_chunk(
             job=job,
             chunk_records=stream_buffer,
+            sink_buffer=sink_buffer,
             seen_dedupe_keys=seen_dedupe_keys,
             report=report,
             chunk_index=next_chunk,
@@ -292,6 +491,7 @@ class ScrapeEngine:
         job: ScrapeJob,
         stream_mode: bool,
         stream_buffer: List[Record],
+        sink_buffer: List[Record],
         seen_dedupe_keys: Set[str],
         report: ScrapeReport,
         records: List[Record],
@@ -302,6 +502,7 @@ class ScrapeEngine:
             return self._finalize_stream_run(
                 job,
                 stream_buffer,
+                sink_buffer,
                 seen_dedupe_keys,
                 report,
                 chunks_flushed,
@@ -319,6 +520,7 @@ class ScrapeEngine:
         self,
         job: ScrapeJob,
         stream_buffer: List[Record],
+        sink_buffer: List[Record],
         seen_dedupe_keys: Set[str],
         report: ScrapeReport,
         chunks_flushed: int,
@@ -329,14 +531,16 @@ class ScrapeEngine:
             self._flush_stream_chunk(
                 job=job,
                 chunk_records=stream_buffer,
+                sink_buffer=sink_buffer,
                 seen_dedupe_keys=seen_dedupe_keys,
                 report=report,
                 chunk_index=chunks_flushed,
                 force_full_refresh=force_full_refresh,
             )
+        self._write_sink_buffer(job, sink_buffer, report)
 
         # Keep legacy behavior for empty runs (create empty output/header where applicable).
-        if report.records_emitted == 0:
+        if report.records_emitted == 0 and getattr(self.sink, "creates_empty_output", False):
             self.sink.write(job, [])
         return chunks_flushed
 
@@ -344,6 +548,7 @@ class ScrapeEngine:
         self,
         job: ScrapeJob,
         chunk_records: List[Record],
+        sink_buffer: List[Record],
         seen_dedupe_keys: Set[str],
         report: ScrapeReport,
         chunk_index: int,
@@ -353,48 +558,90 @@ class ScrapeEngine:
         if not chunk_records:
             return
 
-        deduped_records, local_unique_count, cross_chunk_duplicates = self._dedupe_stream_chunk(
+        deduped_records, dedupe_keys, local_unique_count, cross_chunk_duplicates = self._dedupe_stream_chunk(
             chunk_records, seen_dedupe_keys
         )
         processed_records = self._apply_processing(job, deduped_records, report)
-        emittable_records = self._apply_incremental(job, processed_records, report, force_full_refresh=force_full_refresh)
+        # Keys are only reusable when processing handed back the deduped list untouched.
+        emittable_records = self._apply_incremental(
+            job,
+            processed_records,
+            report,
+            force_full_refresh=force_full_refresh,
+            keys=dedupe_keys if processed_records is deduped_records else None,
+        )
 
-        written = len(emittable_records)
-        if written:
-            self.sink.write(job, emittable_records)
-            report.records_emitted += written
+        emitted = len(emittable_records)
+        sink_buffer.extend(emittable_records)
+        if len(sink_buffer) >= self._sink_flush_threshold(job):
+            self._write_sink_buffer(job, sink_buffer, report)
 
+        # Cards already dropped before enrichment still count as this chunk's input and cross-chunk duplicates.
+        prefiltered, self._prefiltered_duplicates = self._prefiltered_duplicates, 0
         self.log.info(
-            "Chunk flushed: index=%s input=%s local_unique=%s cross_chunk_duplicates=%s written=%s",
+            "Chunk flushed: index=%s input=%s local_unique=%s cross_chunk_duplicates=%s emitted=%s sink_pending=%s",
             chunk_index,
-            len(chunk_records),
-            local_unique_count,
-            cross_chunk_duplicates,
-            written,
+            len(chunk_records) + prefiltered,
+            local_unique_count + prefiltered,
+            cross_chunk_duplicates + prefiltered,
+            emitted,
+            len(sink_buffer),
         )
 
+    def _sink_flush_threshold(self, job: ScrapeJob) -> int:
+        # Unset: every non-empty chunk is written as soon as it is flushed.
+        return max(1, int(getattr(job, "sink_flush_records", None) or 1))
+
+    def _write_sink_buffer(self, job: ScrapeJob, sink_buffer: List[Record], report: ScrapeReport) -> None:
+        """Write records collected from one or more stream chunks in a single sink call."""
+        if not sink_buffer:
+            return
+        # Taken out of the buffer first: a failed write is not retried by the failure path.
+        pending = list(sink_buffer)
+        sink_buffer.clear()
+        self.sink.write(job, pending)
+        report.records_emitted += len(pending)
+
+    def _write_pending_on_failure(self, job: ScrapeJob, sink_buffer: List[Record], report: ScrapeReport) -> None:
+        if not sink_buffer:
+            return
+        try:
+            self._write_sink_buffer(job, sink_buffer, report)
+        except Exception as e:
+            self.log.warning("Writing buffered records after a failed run failed: %s", type(e).__name__)
+
     def _dedupe_stream_chunk(
         self,
         records: List[Record],
         seen_dedupe_keys: Set[str],
-    ) -> tuple[List[Record], int, int]:
-        """Deduplicate records within chunk and across previous chunks."""
-        local_unique = self.deduper.dedupe(records)
-
+    ) -> tuple[List[Record], List[str], int, int]:
+        """
+        Deduplicate records within chunk and across previous chunks in one pass (first occurrence of a key wins);
+        also returns each kept record's key.
+        """
         unique_records: List[Record] = []
+        unique_keys: List[str] = []
+        chunk_keys: Set[str] = set()
         cross_chunk_duplicates = 0
 
-        for record in local_unique:
+        for record in records:
             key = str(self.deduper.key(record) or "").strip()
-            if not key:
+            if not key or key in chunk_keys:
                 continue
+            chunk_keys.add(key)
             if key in seen_dedupe_keys:
                 cross_chunk_duplicates += 1
                 continue
             seen_dedupe_keys.add(key)
             unique_records.append(record)
+            unique_keys.append(key)
+
+        return unique_records, unique_keys, len(chunk_keys), cross_chunk_duplicates
 
-        return unique_records, len(local_unique), cross_chunk_duplicates
+    def _start_checkpoint_writer(self) -> Optional[BackgroundCheckpointWriter]:
+        if self.state_store is None:
+            return None
+        return BackgroundCheckpointWriter(self.state_store)
 
     def _load_resume_state(self, job: ScrapeJob) -> tuple[Optional[RequestSpec], int]:
         if not self.state_store:
@@ -412,20 +659,26 @@ class ScrapeEngine:
     def _request_to_payload(self, req: Optional[RequestSpec]) -> Optional[Dict[str, Any]]:
         if req is None:
             return None
+        # References the spec's own dicts; BackgroundCheckpointWriter.submit copies them before handing off.
+        params = req.params or {}
+        if any(isinstance(v, (set, frozenset)) for v in params.values()):
+            # Pagination accumulators (e.g. seen-href sets) stay sets in memory; JSON needs lists.
+            params = {k: list(v) if isinstance(v, (set, frozenset)) else v for k, v in params.items()}
         return {
             "url": req.url,
             "method": req.method,
-            "headers": dict(req.headers or {}),
-            "params": dict(req.params or {}),
+            "headers": req.headers or {},
+            "params": params,
             "body": req.body,
         }
 
     def _request_from_payload(self, payload: Dict[str, Any]) -> RequestSpec:
+        # Payloads come fresh from json.loads, so their dicts can be adopted as-is.
         return RequestSpec(
             url=str(payload.get("url") or ""),
             method=str(payload.get("method") or "GET"),
-            headers=dict(payload.get("headers") or {}),
-            params=dict(payload.get("params") or {}),
+            headers=payload.get("headers") or {},
+            params=payload.get("params") or {},
             body=payload.get("body"),
         )
 
@@ -445,6 +698,7 @@ class ScrapeEngine:
         records: List[Record],
         report: ScrapeReport,
         force_full_refresh: bool,
+        keys: Optional[List[str]] = None,
     ) -> List[Record]:
         if not records or not self.state_store:
             return records
@@ -456,25 +710,19 @@ class ScrapeEngine:
         mode = "all" if force_full_refresh else str(getattr(incremental_cfg, "mode", "changed_only") or "changed_only")
         mode = mode.strip().lower()
 
+        if keys is None:
+            keys = [str(self.deduper.key(record) or record.source_url or "").strip() for record in records]
+        tracked = [(key, self._record_content_hash(record)) for key, record in zip(keys, records) if key]
+        # One state-store round-trip per batch; records without a key are always emitted.
+        decisions = iter(self.state_store.decide_and_touch_many(job.id, tracked, mode) if tracked else ())
+
         emitted: List[Record] = []
         skipped = 0
-        for record in records:
-            dedupe_key = str(self.deduper.key(record) or record.source_url or "").strip()
-            if not dedupe_key:
-                emitted.append(record)
-                continue
-
-            content_hash = self._record_content_hash(record)
-            decision = self.state_store.decide_and_touch(
-                job_id=job.id,
-                dedupe_key=dedupe_key,
-                content_hash=content_hash,
-                mode=mode,
-            )
-            if decision.emit:
-                emitted.append(record)
-            else:
+        for key, record in zip(keys, records):
+            if key and not next(decisions).emit:
                 skipped += 1
+                continue
+            emitted.append(record)
 
         if skipped:
             report.records_skipped_incremental += skipped
@@ -509,17 +757,15 @@ class ScrapeEngine:
                 report.processing_stage_metrics[stage_name] = dict(metric)
                 continue
 
-            existing["records_in"] = existing.get("records_in", 0) + int(metric.get("records_in", 0))
-            existing["records_out"] = existing.get("records_out", 0) + int(metric.get("records_out", 0))
-            existing["dropped"] = existing.get("dropped", 0) + int(metric.get("dropped", 0))
-            existing["errors"] = existing.get("errors", 0) + int(metric.get("errors", 0))
+            for counter in ("records_in", "records_out", "dropped", "errors"):
+                existing[counter] = existing.get(counter, 0) + int(metric.get(counter, 0))
             existing["latency_ms"] = round(
                 float(existing.get("latency_ms", 0.0)) + float(metric.get("latency_ms", 0.0)),
                 3,
             )
-            report.processing_stage_metrics[stage_name] = existing
 
     def _merge_processing_artifacts(self, report: ScrapeReport, artifacts: Dict[str, Any]) -> None:
+        # Single-chunk runs keep the stage's artifact as is; later chunks turn it into a list of per-chunk artifacts.
         for stage_name, artifact in artifacts.items():
             if stage_name not in report.processing_artifacts:
                 report.processing_artifacts[stage_name] = artifact
@@ -528,7 +774,6 @@ class ScrapeEngine:
             existing = report.processing_artifacts[stage_name]
             if isinstance(existing, list):
                 existing.append(artifact)
-                report.processing_artifacts[stage_name] = existing
             else:
                 report.processing_artifacts[stage_name] = [existing, artifact]
 
@@ -548,12 +793,14 @@ class ScrapeEngine:
         if not source_url:
             return None
 
-        fields = {}
-        for field in job.field_schema:
-            val = self.adapter.extract_field(card, field, page)
-            fields[field] = val
+        # Adapters that subclass SiteAdapter get extract_fields(); plain duck-typed
+        # adapters only need extract_field().
+        if getattr(type(self.adapter), "extract_fields", None) is not None:
+            fields = self.adapter.extract_fields(card, job.field_schema, page)
+        else:
+            fields = {field: self.adapter.extract_field(card, field, page) for field in job.field_schema}
 
-        rid = stable_hash(normalize_text(source_url))
+        rid = normalized_hash(source_url)
         return Record(
             id=rid,
             source_url=source_url,
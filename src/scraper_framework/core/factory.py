@@ -18,7 +18,6 @@ from scraper_framework.process.registry import create_default_registry
 from scraper_framework.process.runner import ProcessingRunner
 from scraper_framework.sinks.base import Sink
 from scraper_framework.sinks.csv_sink import CsvSink
-from scraper_framework.sinks.gsheet_sink import GoogleSheetsSink
 from scraper_framework.state.base import IncrementalStateStore
 from scraper_framework.state.sqlite_store import SQLiteIncrementalStateStore
 from scraper_framework.transform.dedupe import DedupeStrategy, HashDedupeStrategy, UrlDedupeStrategy
@@ -60,7 +59,7 @@ class ComponentFactory:
         Returns:
             A container with all built components.
         """
-        client = self._http_client()
+        client = self._http_client(job)
         fetcher = self._fetcher(job, client, adapter)
         parser = self._parser(adapter)
         deduper = self._deduper(job)
@@ -99,9 +98,13 @@ class ComponentFactory:
 
     # ---------- Builders (private) ----------
 
-    def _http_client(self) -> RequestsHttpClient:
-        """Create the HTTP client."""
-        return RequestsHttpClient(timeout_s=self.http_timeout_s)
+    def _http_client(self, job: ScrapeJob) -> RequestsHttpClient:
+        """Create the HTTP client, with a connection pool large enough for the job's concurrent fetches."""
+        # Enrichment workers plus the page prefetch thread can all target the same host.
+        concurrent_fetches = max(1, int(getattr(getattr(job, "enrich", None), "workers", 1) or 1))
+        if getattr(job, "prefetch_next_page", False):
+            concurrent_fetches += 1
+        return RequestsHttpClient(timeout_s=self.http_timeout_s, pool_maxsize=concurrent_fetches)
 
     def _fetcher(self, job: ScrapeJob, client: RequestsHttpClient, adapter: SiteAdapter) -> FetchStrategy:
         """Create the fetch strategy based on adapter mode."""
@@ -152,9 +155,12 @@ class ComponentFactory:
         """Create the output sink."""
         sink_type = str(job.sink_config.get("type", "csv")).lower()
         if sink_type in ("google_sheets", "gsheet", "sheets"):
+            # Import locally: gspread/google-auth add noticeable startup time for file-sink jobs.
+            from scraper_framework.sinks.gsheet_sink import GoogleSheetsSink
+
             return GoogleSheetsSink()
 
-        if sink_type == str("jsonl").lower():
+        if sink_type == "jsonl":
             from scraper_framework.sinks.jsonl_sink import JsonlSink
 
             return JsonlSink()
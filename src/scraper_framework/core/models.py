@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from scraper_framework.parse.cards import Card
 
 
 class DedupeMode(str, Enum):
@@ -12,7 +15,7 @@ class DedupeMode(str, Enum):
     BY_HASH = "BY_HASH"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestSpec:
     """Specification for an HTTP request."""
 
@@ -22,6 +25,10 @@ class RequestSpec:
     params: Dict[str, Any] = field(default_factory=dict)
     body: Any = None
 
+    def with_params(self, **updates: Any) -> RequestSpec:
+        """Return a copy of this request with params updated; the original spec is left untouched."""
+        return replace(self, params={**(self.params or {}), **updates})
+
 
 @dataclass(frozen=True)
 class EnrichConfig:
@@ -29,6 +36,7 @@ class EnrichConfig:
 
     enabled: bool = False
     fields: Set[str] = field(default_factory=set)
+    workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -72,8 +80,10 @@ class ScrapeJob:
     start: RequestSpec
     execution_mode: str = "memory"  # memory | stream
     batch_size: int = 500
+    sink_flush_records: Optional[int] = None
     max_pages: int = 5
     delay_ms: int = 800
+    prefetch_next_page: bool = False
     required_fields: Set[str] = field(default_factory=lambda: {"name", "source_url"})
     dedupe_mode: DedupeMode = DedupeMode.BY_SOURCE_URL
     field_schema: List[str] = field(default_factory=list)
@@ -84,7 +94,7 @@ class ScrapeJob:
     sink_config: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Represents a fetched web page."""
 
@@ -92,9 +102,11 @@ class Page:
     status_code: int
     content_type: str
     raw: Any
+    # Cards parsed from this page; filled by the page parser for next_request().
+    cards: List[Card] = field(default_factory=list, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Record:
     """A scraped data record."""
 
@@ -104,7 +116,7 @@ class Record:
     fields: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of record validation."""
 
@@ -112,7 +124,7 @@ class ValidationResult:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeReport:
     """Summary report of a scraping job."""
 
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import threading
+from typing import Dict
+
 from bs4 import BeautifulSoup
 
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Record, RequestSpec
 from scraper_framework.enrich.base import Enricher
 from scraper_framework.fetch.strategies import FetchStrategy
+from scraper_framework.parse.html_utils import HTML_PARSER, compile_selector
 from scraper_framework.utils.logging import get_logger
 
+_DETAIL_CACHE_SIZE = 4096
+
 
 class DetailPageEnricher(Enricher):
     """Enricher that fetches additional data from detail pages."""
@@ -16,33 +22,71 @@ class DetailPageEnricher(Enricher):
         self.fetcher = fetcher
         self.fields = fields
         self.log = get_logger("scraper_framework.enrich")
+        # Listings repeat across pages: recently enriched detail URLs are not fetched and parsed again.
+        # Failed fetches raise and are not cached, so a later duplicate retries them.
+        self._detail_cache: Dict[str, Dict[str, str]] = {}
+        self._detail_cache_lock = threading.Lock()
 
     def should_enrich(self, record: Record) -> bool:
         """Check if the record needs enrichment."""
+        # Without a URL there is no detail page to fetch.
+        if not record.source_url:
+            return False
+        fields = record.fields
         for f in self.fields:
-            if not record.fields.get(f):
+            if not fields.get(f):
                 return True
         return False
 
     def enrich(self, record: Record, adapter: SiteAdapter) -> Record:
         """Enrich the record with data from its detail page."""
         try:
-            page = self.fetcher.fetch(RequestSpec(url=record.source_url))
-            soup = BeautifulSoup(page.raw, "html.parser")
+            detail = self._detail_fields(record.source_url, adapter)
+        except Exception as e:
+            self.log.warning("Enrichment failed for %s (%s)", record.source_url, type(e).__name__)
+            return record
 
-            for field in self.fields:
-                if record.fields.get(field):
-                    continue
+        for field, value in detail.items():
+            if not record.fields.get(field):
+                record.fields[field] = value
+        return record
 
-                loc = adapter.field_locator(f"detail:{field}")
-                if not loc:
-                    continue
+    def _detail_fields(self, url: str, adapter: SiteAdapter) -> Dict[str, str]:
+        with self._detail_cache_lock:
+            detail = self._detail_cache.get(url)
+        if detail is not None:
+            return detail
 
-                el = soup.select_one(loc)
-                if el:
-                    record.fields[field] = el.get_text(" ", strip=True)
+        detail = self._fetch_detail_fields(url, adapter)
+        with self._detail_cache_lock:
+            if len(self._detail_cache) >= _DETAIL_CACHE_SIZE:
+                del self._detail_cache[next(iter(self._detail_cache))]
+            self._detail_cache[url] = detail
+        return detail
 
-        except Exception as e:
-            self.log.warning("Enrichment failed for %s (%s)", record.source_url, type(e).__name__)
+    def _fetch_detail_fields(self, url: str, adapter: SiteAdapter) -> Dict[str, str]:
+        """Fetch a detail page and extract every enrich field it has a locator and a match for."""
+        locators: Dict[str, str] = {}
+        for field in self.fields:
+            loc = adapter.field_locator(f"detail:{field}")
+            if loc:
+                locators[field] = loc
+        if not locators:
+            return {}
 
-        return record
+        page = self.fetcher.fetch(RequestSpec(url=url))
+        soup = BeautifulSoup(page.raw, HTML_PARSER)
+
+        # One document walk for all locators: the first element a locator matches in document
+        # order is the one select_one() would have returned for it.
+        pending = {field: compile_selector(loc) for field, loc in locators.items()}
+        combined = compile_selector(", ".join(dict.fromkeys(locators.values())))
+        detail: Dict[str, str] = {}
+        for el in combined.iselect(soup):
+            for field, selector in list(pending.items()):
+                if selector.match(el):
+                    detail[field] = el.get_text(" ", strip=True)
+                    del pending[field]
+            if not pending:
+                break
+        return detail
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Protocol
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from scraper_framework.core.models import RequestSpec
 from scraper_framework.http.policies import RetryPolicy, backoff_sleep
@@ -19,8 +20,14 @@ class HttpClient(Protocol):
 class RequestsHttpClient:
     """HTTP client using the requests library."""
 
-    def __init__(self, timeout_s: int = 30, retry: RetryPolicy | None = None):
+    def __init__(self, timeout_s: int = 30, retry: RetryPolicy | None = None, pool_maxsize: int | None = None):
         self.session = requests.Session()
+        if pool_maxsize and pool_maxsize > DEFAULT_POOLSIZE:
+            # Keep one reusable keep-alive connection per thread that can hit the same host at once.
+            # Retries stay with RetryPolicy, so the adapter does not retry on its own.
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
         self.timeout_s = timeout_s
         self.retry = retry or RetryPolicy()
         self.log = get_logger("scraper_framework.http")
@@ -40,10 +47,10 @@ class RequestsHttpClient:
                     data=None if isinstance(req.body, (dict, list)) else req.body,
                     timeout=self.timeout_s,
                 )
-                ct = r.headers.get("Content-Type", "")
+                ct = r.headers.get("Content-Type", "").lower()
 
                 # If charset not specified, force utf-8 for HTML-ish content
-                if "charset=" not in ct.lower() and ("text/html" in ct.lower() or "text/plain" in ct.lower()):
+                if "charset=" not in ct and ("text/html" in ct or "text/plain" in ct):
                     r.encoding = "utf-8"
 
                 js = None
@@ -53,7 +60,7 @@ class RequestsHttpClient:
                     except Exception:
                         js = None
 
-                resp = HttpResponse(status_code=r.status_code, headers=dict(r.headers), text=r.text, json=js)
+                resp = HttpResponse(status_code=r.status_code, headers=r.headers, text=r.text, json=js)
 
                 if resp.status_code in self.retry.retry_statuses and attempt < self.retry.max_attempts - 1:
                     self.log.warning("Retrying %s (status=%s, attempt=%s)", req.url, resp.status_code, attempt + 1)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 import time
+from pathlib import Path
 
 try:
     from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
@@ -13,6 +15,22 @@ from scraper_framework.core.models import RequestSpec
 from scraper_framework.http.response import HttpResponse
 from scraper_framework.utils.logging import get_logger
 
+# Returns 1 + the index of the first visible candidate ([kind, selector] pairs), or 0 while none is visible.
+_FIRST_VISIBLE_JS = """
+(candidates) => {
+  for (let i = 0; i < candidates.length; i++) {
+    const [kind, selector] = candidates[i];
+    const el = kind === "css"
+      ? document.querySelector(selector)
+      : document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden") {
+      return i + 1;
+    }
+  }
+  return 0;
+}
+"""
+
 
 class PlaywrightHttpClient:
     """HTTP-like client backed by Playwright Chromium for dynamic pages."""
@@ -28,10 +46,18 @@ class PlaywrightHttpClient:
         self._context = self._browser.new_context(viewport={"width": 1366, "height": 768})
         self._page = self._context.new_page()
         self._current_url: str | None = None
+        # Set once consent is known to hold in this context (saved after a click, or restored
+        # cookies kept the banner away); later pages then skip the consent probe.
+        self._consent_stored = False
+        self._cookies_restored = False
+        self._storage_state_checked = False
 
     def send(self, req: RequestSpec) -> HttpResponse:
         params = req.params or {}
 
+        if self._current_url is None:
+            self._load_storage_state(params)
+
         if self._current_url != req.url:
             self.log.info("Playwright: navigating %s", req.url)
             self._page.goto(req.url, wait_until="domcontentloaded", timeout=self._timeout_ms(self.timeout_s))
@@ -72,9 +98,42 @@ class PlaywrightHttpClient:
         except Exception:
             self.log.debug("Playwright window setup failed")
 
+    def _load_storage_state(self, params: dict) -> None:
+        """Restore consent cookies saved by an earlier run, once, before the first navigation."""
+        path = params.get("cookie_state_path")
+        if not path or self._storage_state_checked:
+            return
+        self._storage_state_checked = True
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._context.add_cookies(state.get("cookies") or [])
+            self._cookies_restored = True
+            self.log.info("Playwright: restored cookies from %s", path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.log.warning("Playwright: could not restore cookies from %s (%s)", path, type(e).__name__)
+
+    def _save_storage_state(self, params: dict) -> None:
+        path = params.get("cookie_state_path")
+        if not path:
+            return
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._context.storage_state(path=path)
+            self._consent_stored = True
+        except Exception as e:
+            self.log.warning("Playwright: could not save cookies to %s (%s)", path, type(e).__name__)
+
     def _apply_cookie_consent(self, params: dict) -> None:
         if params.get("cookies_enabled") is False or params.get("_cookies_handled"):
             return
+        if self._consent_stored:
+            # Consent already holds in this context; there is no banner to wait for.
+            params["_cookies_handled"] = True
+            return
 
         action = str(params.get("cookie_action", "auto")).lower()
         prefer_reject = action in {"auto", "reject"}
@@ -94,16 +153,23 @@ class PlaywrightHttpClient:
         css_selectors = (css_reject + css_accept) if prefer_reject else (css_accept + css_reject)
         xp_selectors = (xp_reject + xp_accept) if prefer_reject else (xp_accept + xp_reject)
 
-        clicked = False
-        for selector in css_selectors:
-            if self._click_selector(selector, timeout_ms=timeout_ms):
-                clicked = True
-                break
-
-        if not clicked:
-            for xpath_selector in xp_selectors:
-                if self._click_xpath(xpath_selector, timeout_ms=timeout_ms):
-                    break
+        # Wait in the browser until any banner button shows up (one round-trip, bounded by a single timeout),
+        # then click it; CSS candidates keep precedence over the text-based XPath ones.
+        candidates = [["css", sel] for sel in css_selectors] + [["xpath", sel] for sel in xp_selectors]
+        try:
+            found = self._page.wait_for_function(_FIRST_VISIBLE_JS, arg=candidates, timeout=timeout_ms).json_value()
+        except Exception:
+            found = 0
+
+        if found:
+            kind, selector = candidates[int(found) - 1]
+            click = self._click_selector if kind == "css" else self._click_xpath
+            if click(selector, timeout_ms=timeout_ms):
+                self._save_storage_state(params)
+        elif self._cookies_restored:
+            # The restored cookies are still accepted (no banner), so later pages need no probe.
+            # Expired or rejected ones bring the banner back, which is then clicked and saved again.
+            self._consent_stored = True
 
         params["_cookies_handled"] = True
 
@@ -136,19 +202,16 @@ class PlaywrightHttpClient:
         prev_count = params.get("scroll_prev_count")
         wait_time_s = float(params.get("scroll_wait_time", 6))
 
-        self._page.evaluate("window.scrollBy(0, arguments[0])", px)
+        self._page.evaluate("(px) => window.scrollBy(0, px)", px)
         time.sleep(max(0.0, pause_s))
 
-        if wait_selector and isinstance(prev_count, int):
-            deadline = time.time() + max(0.0, wait_time_s)
-            while time.time() < deadline:
-                try:
-                    now_count = self._page.locator(wait_selector).count()
-                except Exception:
-                    break
-                if now_count > prev_count:
-                    break
-                time.sleep(max(0.05, pause_s))
+        timeout_ms = self._timeout_ms(wait_time_s)
+        if wait_selector and isinstance(prev_count, int) and timeout_ms > 0:
+            # Playwright waits for the (prev_count + 1)-th match itself, returning as soon as it is attached.
+            try:
+                self._page.locator(wait_selector).nth(prev_count).wait_for(state="attached", timeout=timeout_ms)
+            except Exception:
+                self.log.debug("Playwright: no new matches for %s after scroll", wait_selector)
 
     def _apply_reveal_click(self, params: dict) -> None:
         if params.get("reveal_enabled") is False:
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HttpResponse:
     """HTTP response data."""
 
     status_code: int
-    headers: Dict[str, str]
+    # Case-insensitive for requests responses (the response's CaseInsensitiveDict, not a copy).
+    headers: Mapping[str, str]
     text: str
     json: Any
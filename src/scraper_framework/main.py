@@ -103,7 +103,7 @@ def main() -> None:
         raise SystemExit(1)
 
     setup_logging("configs/logging.yaml")
-    register_all()
+    register_all([adapter_key])
 
     
     if schedule_cfg:
@@ -5,6 +5,8 @@ from typing import Any, Optional, Protocol
 
 from bs4 import BeautifulSoup
 
+from scraper_framework.parse.html_utils import compile_selector
+
 
 class Card(Protocol):
     """Protocol for card elements."""
@@ -28,19 +30,25 @@ class HtmlCard:
         """Return the raw element."""
         return self._root
 
+    def _select(self, locator: str) -> Any:
+        """Resolve a CSS selector; an empty locator addresses the card root itself."""
+        if not locator:
+            return self._root
+        return compile_selector(locator).select_one(self._root)
+
     def get_text(self, locator: str) -> Optional[str]:
-        """Get text from a CSS selector."""
-        el = self._root.select_one(locator)
+        """Get text from a CSS selector; an empty locator reads the card root."""
+        el = self._select(locator)
         return el.get_text(" ", strip=True) if el else None
 
     def get_attr(self, locator: str, attr: str) -> Optional[str]:
-        """Get attribute value from a CSS selector."""
-        el = self._root.select_one(locator)
+        """Get attribute value from a CSS selector (empty locator: the card root); multi-valued attributes are space-joined."""
+        el = self._select(locator)
         if not el or not el.has_attr(attr):
             return None
         raw_value = el.get(attr)
         if isinstance(raw_value, list):
-            return str(raw_value[0]) if raw_value else None
+            return " ".join(str(v) for v in raw_value) if raw_value else None
         return str(raw_value) if raw_value is not None else None
 
     def get_value(self, locator: str) -> Any:
@@ -1,9 +1,66 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import re
+from functools import lru_cache
+from typing import Any, List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree as lxml_etree
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    lxml_etree = None
+    HTML_PARSER = "html.parser"
+
+_NEXT_LINK_CANDIDATES = (
+    'a[rel="next"]',
+    "a.next",
+    ".pagination a[aria-label*=Next]",
+    ".pagination a[rel=next]",
+    "li.next a",
+)
+_NEXT_LINK_FEED_CHUNK = 64 * 1024
+
+
+@lru_cache(maxsize=256)
+def compile_selector(css: str) -> Any:
+    """
+    Compile a CSS selector once and reuse it.
+
+    Adapter locators are literal constants, so every card after the first
+    skips selector parsing entirely.
+    """
+    return soupsieve.compile(css)
+
+
+@lru_cache(maxsize=64)
+def card_strainer(tag: str, css_class: Optional[str] = None) -> SoupStrainer:
+    """
+    Build a SoupStrainer limiting tree construction to card containers.
+
+    Attributes are still raw strings while the tree is built, so the class is
+    matched as a whitespace-separated token rather than by equality.
+    """
+    if not css_class:
+        return SoupStrainer(tag)
+    token = re.compile(r"(?:^|\s)" + re.escape(css_class) + r"(?:\s|$)")
+    return SoupStrainer(tag, attrs={"class": token})
+
+
+def join_url(base_url: str, href: str) -> str:
+    """
+    Resolve href against base_url.
+
+    Absolute http(s) hrefs are returned as-is without touching urljoin; everything
+    else goes through urljoin, whose base-URL split is already cached by urllib.
+    """
+    if href.startswith(("https://", "http://")):
+        return href
+    return urljoin(base_url, href)
 
 
 def find_next_url(html: str, base_url: str) -> Optional[str]:
@@ -11,22 +68,87 @@ def find_next_url(html: str, base_url: str) -> Optional[str]:
     Finds a "next page" link in common patterns.
     Works across many directory sites.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if lxml_etree is not None:
+        try:
+            href = _scan_next_href(html)
+        except (lxml_etree.LxmlError, ValueError):
+            href = _select_next_href(html)
+    else:
+        href = _select_next_href(html)
+    return join_url(base_url, href) if href is not None else None
 
-    candidates = [
-        'a[rel="next"]',
-        "a.next",
-        ".pagination a[aria-label*=Next]",
-        ".pagination a[rel=next]",
-        "li.next a",
-    ]
 
-    for css in candidates:
-        a = soup.select_one(css)
+def _select_next_href(html: str) -> Optional[str]:
+    """Reference implementation: full parse, then try each candidate selector."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    for css in _NEXT_LINK_CANDIDATES:
+        a = compile_selector(css).select_one(soup)
         if a and a.has_attr("href"):
             href_raw: Any = a.get("href")
             href = href_raw[0] if isinstance(href_raw, list) else href_raw
             if href is not None:
-                return urljoin(base_url, str(href))
+                return str(href)
 
     return None
+
+
+def _scan_next_href(html: str) -> Optional[str]:
+    """
+    Streaming equivalent of _select_next_href.
+
+    Feeds the document to an lxml pull parser in chunks and inspects <a> start
+    tags as they arrive. Parsing stops as soon as the winning candidate is known,
+    which for rel="next" links is usually well before the end of the page.
+    """
+    parser = lxml_etree.HTMLPullParser(events=("start",), tag="a")
+    # Per candidate: None = no match yet, else (href or None) of its first match.
+    first: List[Optional[tuple]] = [None] * len(_NEXT_LINK_CANDIDATES)
+
+    for offset in range(0, len(html), _NEXT_LINK_FEED_CHUNK):
+        parser.feed(html[offset : offset + _NEXT_LINK_FEED_CHUNK])
+        _record_next_candidates(parser, first)
+        decided, href = _pick_next_href(first, final=False)
+        if decided:
+            return href
+
+    parser.close()
+    _record_next_candidates(parser, first)
+    return _pick_next_href(first, final=True)[1]
+
+
+def _record_next_candidates(parser: Any, first: List[Optional[tuple]]) -> None:
+    for _, a in parser.read_events():
+        rel = a.get("rel")
+        classes = (a.get("class") or "").split()
+        in_pagination = in_li_next = False
+        for anc in a.iterancestors():
+            anc_classes = (anc.get("class") or "").split()
+            if "pagination" in anc_classes:
+                in_pagination = True
+            if anc.tag == "li" and "next" in anc_classes:
+                in_li_next = True
+
+        matches = (
+            rel == "next",
+            "next" in classes,
+            in_pagination and "Next" in (a.get("aria-label") or ""),
+            in_pagination and rel == "next",
+            in_li_next,
+        )
+        for i, matched in enumerate(matches):
+            if matched and first[i] is None:
+                first[i] = (a.get("href"),)
+
+
+def _pick_next_href(first: List[Optional[tuple]], final: bool) -> tuple[bool, Optional[str]]:
+    # Candidates are tried in priority order; one whose first match lacks href is skipped,
+    # but an unmatched candidate can still match later in the document.
+    for entry in first:
+        if entry is None:
+            if not final:
+                return False, None
+            continue
+        if entry[0] is not None:
+            return True, entry[0]
+    return True, None
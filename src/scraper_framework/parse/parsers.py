@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 from scraper_framework.adapters.base import SiteAdapter
 from scraper_framework.core.models import Page, RequestSpec
 from scraper_framework.parse.cards import Card, HtmlCard, JsonCard
+from scraper_framework.parse.html_utils import HTML_PARSER, card_strainer, compile_selector
 
 
 class PageParser(Protocol):
@@ -23,12 +24,14 @@ class HtmlPageParser:
 
     def parse_cards(self, page: Page, adapter: SiteAdapter) -> List[Card]:
         """Parse cards from an HTML page."""
-        soup = BeautifulSoup(page.raw, "html.parser")
+        hint = adapter.card_locator_tag()
+        parse_only = card_strainer(*hint) if hint else None
+        soup = BeautifulSoup(page.raw, HTML_PARSER, parse_only=parse_only)
         locator = adapter.card_locator()
-        cards: List[Card] = [HtmlCard(el) for el in soup.select(locator)]
+        cards: List[Card] = [HtmlCard(el) for el in compile_selector(locator).select(soup)]
 
         # cache for next_request()
-        setattr(page, "_cards_cache", cards)
+        page.cards = cards
         return cards
 
     def next_request(self, page: Page, adapter: SiteAdapter, current: RequestSpec) -> Optional[RequestSpec]:
@@ -51,7 +54,7 @@ class JsonPageParser:
                 cur = None
         items = cur if isinstance(cur, list) else []
         cards: List[Card] = [JsonCard(obj) for obj in items]
-        setattr(page, "_cards_cache", cards)
+        page.cards = cards
         return cards
 
     def next_request(self, page: Page, adapter: SiteAdapter, current: RequestSpec) -> Optional[RequestSpec]:
@@ -4,8 +4,14 @@ from typing import List, Protocol
 
 from scraper_framework.core.models import Record, ScrapeJob
 
+# Buffer size for file sinks: a coalesced stream write of thousands of rows reaches the OS in a few large writes.
+FILE_WRITE_BUFFER_BYTES = 1 << 20
+
 
 class Sink(Protocol):
     """Protocol for output sinks."""
 
+    # Whether an empty write([]) still produces output (a header or truncated file) for runs that emit no records.
+    creates_empty_output: bool = False
+
     def write(self, job: ScrapeJob, records: List[Record]) -> None: ...
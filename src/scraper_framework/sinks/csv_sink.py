@@ -6,13 +6,15 @@ from pathlib import Path
 from typing import List
 
 from scraper_framework.core.models import Record, ScrapeJob
-from scraper_framework.sinks.base import Sink
+from scraper_framework.sinks.base import FILE_WRITE_BUFFER_BYTES, Sink
 from scraper_framework.utils.logging import get_logger
 
 
 class CsvSink(Sink):
     """Sink that writes records to a CSV file."""
 
+    creates_empty_output = True
+
     def __init__(self):
         self._stream_initialized = False
         self._stream_path = None
@@ -36,7 +38,7 @@ class CsvSink(Sink):
 
         file_mode, write_header = self._resolve_file_mode(path, write_mode, execution_mode)
 
-        with open(path, file_mode, newline="", encoding="utf-8") as f:
+        with open(path, file_mode, newline="", encoding="utf-8", buffering=FILE_WRITE_BUFFER_BYTES) as f:
             w = csv.DictWriter(f, fieldnames=cols)
             if write_header:
                 w.writeheader()
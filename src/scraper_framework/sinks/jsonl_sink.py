@@ -3,13 +3,15 @@ from pathlib import Path
 from typing import List
 
 from scraper_framework.core.models import Record, ScrapeJob
-from scraper_framework.sinks.base import Sink
+from scraper_framework.sinks.base import FILE_WRITE_BUFFER_BYTES, Sink
 from scraper_framework.utils.logging import get_logger
 
 
 class JsonlSink(Sink):
     """Sink that writes records to a JSONL (JSON Lines) file."""
 
+    creates_empty_output = True
+
     def __init__(self):
         self._stream_initialized = False
         self._stream_path = None
@@ -28,7 +30,7 @@ class JsonlSink(Sink):
 
         file_mode = self._resolve_file_mode(path, write_mode, execution_mode)
 
-        with open(path, file_mode, encoding="utf-8") as f:
+        with open(path, file_mode, encoding="utf-8", buffering=FILE_WRITE_BUFFER_BYTES) as f:
             for r in records:
                 record_dict = {"id": r.id, "source_url": r.source_url, "scraped_at_utc": r.scraped_at_utc}
                 record_dict.update(r.fields)
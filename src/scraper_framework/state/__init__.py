@@ -1,7 +1,9 @@
 from scraper_framework.state.base import IncrementalDecision, IncrementalStateStore, RunCheckpoint
+from scraper_framework.state.checkpoint_writer import BackgroundCheckpointWriter
 from scraper_framework.state.sqlite_store import SQLiteIncrementalStateStore
 
 __all__ = [
+    "BackgroundCheckpointWriter",
     "IncrementalDecision",
     "IncrementalStateStore",
     "RunCheckpoint",
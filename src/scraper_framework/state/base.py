@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -49,3 +49,21 @@ class IncrementalStateStore(Protocol):
         content_hash: str,
         mode: str,
     ) -> IncrementalDecision: ...
+
+    def decide_and_touch_many(
+        self,
+        job_id: str,
+        items: Sequence[Tuple[str, str]],
+        mode: str,
+    ) -> List[IncrementalDecision]:
+        """
+        Decide whether each (dedupe_key, content_hash) is emitted and record the sighting.
+        In new_only mode a known key is never emitted, so its content_hash and last_changed_utc
+        are left as they were: a later changed_only or full-refresh run still compares against
+        the last content that was actually emitted.
+        """
+        ...
+
+    def find_known_keys(self, job_id: str, keys: Sequence[str]) -> Set[str]:
+        """Return the keys that already have state, without touching them."""
+        ...
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from scraper_framework.state.base import IncrementalStateStore
+from scraper_framework.utils.logging import get_logger
+
+
+class BackgroundCheckpointWriter:
+    """
+    Persists run checkpoints on a background thread.
+    Only the newest pending checkpoint is kept; older ones it supersedes are never written.
+    """
+
+    def __init__(self, state_store: IncrementalStateStore):
+        self.state_store = state_store
+        self.log = get_logger("scraper_framework.state.checkpoint")
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[str, Optional[Dict[str, Any]], int, str]] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        job_id: str,
+        request_payload: Optional[Dict[str, Any]],
+        page_index: int,
+        status: str = "in_progress",
+    ) -> None:
+        """Queue a checkpoint, replacing any checkpoint that has not been written yet."""
+        # Snapshot the payload's dicts now: clients record per-run flags in the live request params
+        # (e.g. _cookies_handled) while this thread serializes. One level is enough; values are not walked.
+        snapshot = None
+        if request_payload is not None:
+            snapshot = {k: dict(v) if isinstance(v, dict) else v for k, v in request_payload.items()}
+        with self._cond:
+            self._pending = (job_id, snapshot, page_index, status)
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Write the pending checkpoint, if any, and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                job_id, payload, page_index, status = self._pending
+                self._pending = None
+
+            try:
+                self.state_store.save_checkpoint(job_id, payload, page_index, status=status)
+            except Exception as e:
+                self.log.warning("Checkpoint write failed: %s", type(e).__name__)
@@ -4,11 +4,14 @@ import json
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from scraper_framework.state.base import IncrementalDecision, RunCheckpoint
 from scraper_framework.utils.time import utc_now_iso
 
+# Keys per "IN (...)" lookup; stays under SQLite's default host-parameter limit.
+_LOOKUP_CHUNK_SIZE = 500
+
 
 class SQLiteIncrementalStateStore:
     """SQLite-backed state store for incremental runs and checkpoints."""
@@ -124,60 +127,113 @@ class SQLiteIncrementalStateStore:
         content_hash: str,
         mode: str,
     ) -> IncrementalDecision:
-        key = str(dedupe_key or "").strip()
-        if not key:
+        return self.decide_and_touch_many(job_id, [(dedupe_key, content_hash)], mode)[0]
+
+    def decide_and_touch_many(
+        self,
+        job_id: str,
+        items: Sequence[Tuple[str, str]],
+        mode: str,
+    ) -> List[IncrementalDecision]:
+        """Decide and touch (dedupe_key, content_hash) pairs in order, in one transaction."""
+        keyed = [(str(dedupe_key or "").strip(), content_hash) for dedupe_key, content_hash in items]
+        if any(not key for key, _ in keyed):
             raise ValueError("dedupe_key cannot be empty for incremental state")
 
         normalized_mode = str(mode or "").strip().lower()
         if normalized_mode not in {"all", "new_only", "changed_only"}:
             raise ValueError(f"Unsupported incremental mode: {mode}")
 
+        if not keyed:
+            return []
+
         now = utc_now_iso()
+        decisions: List[IncrementalDecision] = []
+        inserts: List[Tuple[Any, ...]] = []
+        updates: List[Tuple[Any, ...]] = []
         with self._session() as conn:
-            row = conn.execute(
-                """
-                SELECT content_hash, first_seen_utc, last_changed_utc, seen_count
-                FROM record_state
-                WHERE job_id = ? AND dedupe_key = ?
-                """,
-                (job_id, key),
-            ).fetchone()
+            # key -> (content_hash, last_changed_utc); kept current so repeated keys in a batch
+            # see the earlier item, exactly as sequential calls would.
+            known = self._load_record_states(conn, job_id, {key for key, _ in keyed})
+
+            for key, content_hash in keyed:
+                state = known.get(key)
+                if state is None:
+                    inserts.append((job_id, key, content_hash, now, now, now))
+                    known[key] = (content_hash, now)
+                    decisions.append(IncrementalDecision(emit=True, is_new=True, changed=True))
+                    continue
+
+                previous_hash, previous_changed = state
+                changed = previous_hash != content_hash
 
-            if not row:
-                conn.execute(
+                if normalized_mode == "new_only":
+                    # Not emitted, so the stored content stays the last emitted one; only the sighting is recorded.
+                    updates.append((previous_hash, now, previous_changed, job_id, key))
+                    decisions.append(IncrementalDecision(emit=False, is_new=False, changed=changed))
+                    continue
+
+                emit = True if normalized_mode == "all" else changed
+                last_changed = now if changed else (previous_changed or now)
+                updates.append((content_hash, now, last_changed, job_id, key))
+                known[key] = (content_hash, last_changed)
+                decisions.append(IncrementalDecision(emit=emit, is_new=False, changed=changed))
+
+            if inserts:
+                conn.executemany(
                     """
                     INSERT INTO record_state
                     (job_id, dedupe_key, content_hash, first_seen_utc, last_seen_utc, last_changed_utc, seen_count)
                     VALUES (?, ?, ?, ?, ?, ?, 1)
                     """,
-                    (job_id, key, content_hash, now, now, now),
+                    inserts,
+                )
+            if updates:
+                conn.executemany(
+                    """
+                    UPDATE record_state
+                    SET content_hash = ?,
+                        last_seen_utc = ?,
+                        last_changed_utc = ?,
+                        seen_count = seen_count + 1
+                    WHERE job_id = ? AND dedupe_key = ?
+                    """,
+                    updates,
                 )
-                return IncrementalDecision(emit=True, is_new=True, changed=True)
 
-            previous_hash = str(row["content_hash"] or "")
-            changed = previous_hash != content_hash
+        return decisions
 
-            if normalized_mode == "all":
-                emit = True
-            elif normalized_mode == "new_only":
-                emit = False
-            else:
-                emit = changed
+    def find_known_keys(self, job_id: str, keys: Sequence[str]) -> Set[str]:
+        """Return the keys that already have state, without touching them."""
+        unique_keys = list(dict.fromkeys(key for key in (str(k or "").strip() for k in keys) if key))
+        if not unique_keys:
+            return set()
 
-            last_changed = now if changed else str(row["last_changed_utc"] or now)
-            conn.execute(
-                """
-                UPDATE record_state
-                SET content_hash = ?,
-                    last_seen_utc = ?,
-                    last_changed_utc = ?,
-                    seen_count = seen_count + 1
-                WHERE job_id = ? AND dedupe_key = ?
+        with self._session() as conn:
+            return set(self._load_record_states(conn, job_id, unique_keys))
+
+    def _load_record_states(
+        self,
+        conn: sqlite3.Connection,
+        job_id: str,
+        keys: Iterable[str],
+    ) -> Dict[str, Tuple[str, str]]:
+        states: Dict[str, Tuple[str, str]] = {}
+        pending = list(keys)
+        for start in range(0, len(pending), _LOOKUP_CHUNK_SIZE):
+            chunk = pending[start : start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"""
+                SELECT dedupe_key, content_hash, last_changed_utc
+                FROM record_state
+                WHERE job_id = ? AND dedupe_key IN ({placeholders})
                 """,
-                (content_hash, now, last_changed, job_id, key),
+                (job_id, *chunk),
             )
-
-            return IncrementalDecision(emit=emit, is_new=False, changed=changed)
+            for row in rows:
+                states[row["dedupe_key"]] = (str(row["content_hash"] or ""), str(row["last_changed_utc"] or ""))
+        return states
 
     def _ensure_schema(self) -> None:
         with self._session() as conn:
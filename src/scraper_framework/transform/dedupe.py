@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Dict, List, Protocol
 
 from scraper_framework.core.models import Record
-from scraper_framework.utils.hashing import normalize_text, stable_hash
+from scraper_framework.utils.hashing import normalized_hash
 from scraper_framework.utils.logging import get_logger
 
 
@@ -64,7 +64,7 @@ class HashDedupeStrategy:
     def key(self, record: Record) -> str:
         """Generate dedupe key from hash of source URL or name."""
         basis = record.source_url or (record.fields.get("name") or "")
-        return stable_hash(normalize_text(str(basis)))
+        return normalized_hash(str(basis))
 
     def dedupe(self, records: List[Record]) -> List[Record]:
         """Remove duplicate records based on hash."""
@@ -4,6 +4,9 @@ from typing import Protocol, Set
 
 from scraper_framework.core.models import Record, ValidationResult
 
+# ValidationResult is frozen, so every passing record can share one instance.
+_VALID = ValidationResult(True, "")
+
 
 class Validator(Protocol):
     """Protocol for record validators."""
@@ -25,4 +28,4 @@ class RequiredFieldsValidator:
                 v = record.fields.get(f)
                 if v is None or str(v).strip() == "":
                     return ValidationResult(False, f"missing_{f}")
-        return ValidationResult(True, "")
+        return _VALID
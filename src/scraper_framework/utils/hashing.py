@@ -1,8 +1,11 @@
 import hashlib
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Any
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def stable_hash(text: str) -> str:
     """Generate a stable hash from text."""
@@ -26,10 +29,16 @@ def normalize_text(
 
     text = str(value)
 
-    # Unicode normalization (very important for scraping)
-    if normalize_unicode:
+    # Unicode normalization (very important for scraping); ASCII is already NFKC.
+    if normalize_unicode and not text.isascii():
         text = unicodedata.normalize("NFKC", text)
 
+    if strip and collapse_whitespace:
+        # split() uses the same whitespace definition as str.strip() and "\s",
+        # and covers line endings as well.
+        text = " ".join(text.split())
+        return text.lower() if lowercase else text
+
     # Standardize line endings
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
@@ -37,9 +46,18 @@ def normalize_text(
         text = text.strip()
 
     if collapse_whitespace:
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
 
     if lowercase:
         text = text.lower()
 
     return text
+
+
+@lru_cache(maxsize=65536)
+def normalized_hash(text: str) -> str:
+    """
+    stable_hash(normalize_text(text)) with default normalization, cached for short identifiers
+    (URLs, names) that repeat across pages. Both steps are pure, so cached results never go stale.
+    """
+    return stable_hash(normalize_text(text))
@@ -1,23 +1,76 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 
 import yaml
 
+# (logger, the QueueHandler put in place of its handlers, the listener running those handlers)
+_installed: List[Tuple[logging.Logger, logging.handlers.QueueHandler, logging.handlers.QueueListener]] = []
+
+
+def setup_logging(config_path: str = "configs/logging.yaml", queued: bool = True) -> None:
+    """
+    Setup logging configuration from YAML file.
+    With queued=True, the configured handlers run on a background listener thread so
+    formatting output and stream/file I/O stay off the scraping thread.
+    """
+    stop_queued_logging()
 
-def setup_logging(config_path: str = "configs/logging.yaml") -> None:
-    """Setup logging configuration from YAML file."""
     path = Path(config_path)
     if not path.exists():
         # Safe fallback
         logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
-        return
+        logger_names: List[Optional[str]] = [None]
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            cfg = yaml.safe_load(f)
+        logging.config.dictConfig(cfg)
+        logger_names = list((cfg.get("loggers") or {}).keys())
+        if "root" in cfg:
+            logger_names.append(None)
+
+    if queued:
+        _queue_handlers(logger_names)
+
+
+def stop_queued_logging() -> None:
+    """
+    Drain pending log records, stop the listener threads started by setup_logging and
+    put each logger's original handlers back in place of its queue handler.
+    """
+    while _installed:
+        logger, queue_handler, listener = _installed.pop()
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
+
+def _queue_handlers(logger_names: Iterable[Optional[str]]) -> None:
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        handlers = list(logger.handlers)
+        if not handlers:
+            continue
+
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        queue_handler = logging.handlers.QueueHandler(records)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        listener.start()
+        _installed.append((logger, queue_handler, listener))
+
 
-    with path.open("r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
-    logging.config.dictConfig(cfg)
+# Registered after the logging module's own hook, so it runs first and flushes the queues.
+atexit.register(stop_queued_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
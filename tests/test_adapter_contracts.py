@@ -99,6 +99,33 @@ class TestAdapterContracts(unittest.TestCase):
             key = adapter.key()
             self.assertRegex(key, valid_pattern, f"Adapter key contains invalid characters: {key}")
 
+    def test_extract_fields_matches_per_field_extraction(self):
+        """Test that the batched extract_fields default agrees with extract_field."""
+        from bs4 import BeautifulSoup
+
+        from src.scraper_framework.core.models import Page
+        from src.scraper_framework.parse.cards import HtmlCard
+
+        html = '<div class="listing"><h3 class="name"><a href="/biz/1">Acme</a></h3><div class="address">Berlin</div></div>'
+        page = Page(url="https://example.com", status_code=200, content_type="text/html", raw=html)
+        card = HtmlCard(BeautifulSoup(html, "html.parser").div)
+        fields = ["name", "address", "phone"]
+
+        for adapter in get_registered_adapters():
+            expected = {f: adapter.extract_field(card, f, page) for f in fields}
+            self.assertEqual(adapter.extract_fields(card, fields, page), expected, f"Adapter {adapter.key()}")
+
+    def test_register_all_can_limit_to_requested_keys(self):
+        """Test that register_all(keys) registers only the requested adapters."""
+        from unittest.mock import patch
+
+        from src.scraper_framework.adapters import sites
+
+        with patch.object(sites, "register") as register:
+            register_all(["books_toscrape"])
+
+        self.assertEqual([c.args[0].key() for c in register.call_args_list], ["books_toscrape"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
+import json
+import os
+import tempfile
 import types
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 from src.scraper_framework.core.factory import ComponentFactory
-from src.scraper_framework.core.models import RequestSpec, ScrapeJob
+from src.scraper_framework.core.models import EnrichConfig, RequestSpec, ScrapeJob
 
 
 class _DynamicAdapter:
@@ -60,6 +64,125 @@ class TestFactoryDynamicEngines(unittest.TestCase):
 
         self.assertEqual(getattr(fetcher.client, "engine", ""), "selenium")
 
+    def test_http_client_pool_covers_enrich_workers_and_prefetch(self):
+        factory = ComponentFactory(http_timeout_s=10)
+        job = ScrapeJob(
+            id="job-pool",
+            name="job-pool",
+            start=RequestSpec(url="https://example.com"),
+            prefetch_next_page=True,
+            enrich=EnrichConfig(enabled=True, fields={"name"}, workers=16),
+        )
+
+        client = factory._http_client(job)
+
+        pool_kw = client.session.get_adapter("https://example.com").poolmanager.connection_pool_kw
+        self.assertEqual(pool_kw["maxsize"], 17)
+
+
+class TestPlaywrightClientActions(unittest.TestCase):
+    def _client(self):
+        from src.scraper_framework.http.playwright_client import PlaywrightHttpClient
+
+        client = PlaywrightHttpClient.__new__(PlaywrightHttpClient)
+        client.log = Mock()
+        client.timeout_s = 30
+        client._page = Mock()
+        client._context = Mock()
+        client._consent_stored = False
+        client._cookies_restored = False
+        client._storage_state_checked = False
+        return client
+
+    def test_cookie_consent_probes_all_candidates_in_one_wait_then_clicks(self):
+        client = self._client()
+        client._page.wait_for_function.return_value.json_value.return_value = 2  # the accept button
+        params = {"cookie_action": "reject", "cookie_timeout": 3}
+
+        with patch.object(client, "_click_selector", return_value=True) as click:
+            client._apply_cookie_consent(params)
+
+        client._page.wait_for_function.assert_called_once()
+        candidates = client._page.wait_for_function.call_args.kwargs["arg"]
+        self.assertEqual(candidates[:2], [["css", "#onetrust-reject-all-handler"], ["css", "#onetrust-accept-btn-handler"]])
+        self.assertEqual(client._page.wait_for_function.call_args.kwargs["timeout"], 3000)
+        click.assert_called_once_with("#onetrust-accept-btn-handler", timeout_ms=3000)
+        self.assertTrue(params["_cookies_handled"])
+
+    def test_cookie_consent_without_banner_clicks_nothing(self):
+        client = self._client()
+        client._page.wait_for_function.side_effect = TimeoutError("no banner")
+        params = {}
+
+        with patch.object(client, "_click_selector") as click, patch.object(client, "_click_xpath") as click_xpath:
+            client._apply_cookie_consent(params)
+
+        click.assert_not_called()
+        click_xpath.assert_not_called()
+        self.assertTrue(params["_cookies_handled"])
+
+    def test_cookie_state_is_saved_after_consent_and_restored_on_next_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = os.path.join(tmp, "state", "cookies.json")
+            params = {"cookie_state_path": state_path}
+
+            first = self._client()
+            first._page.wait_for_function.return_value.json_value.return_value = 1
+            first._context.storage_state.side_effect = lambda path: Path(path).write_text(
+                json.dumps({"cookies": [{"name": "OptanonConsent", "value": "x"}], "origins": []})
+            )
+            with patch.object(first, "_click_selector", return_value=True):
+                first._apply_cookie_consent(params)
+            first._context.storage_state.assert_called_once_with(path=state_path)
+
+            second = self._client()
+            second._page.wait_for_function.side_effect = TimeoutError("no banner")
+            params = {"cookie_state_path": state_path}
+            second._load_storage_state(params)
+            second._apply_cookie_consent(params)
+            second._context.add_cookies.assert_called_once_with([{"name": "OptanonConsent", "value": "x"}])
+            self.assertTrue(params["_cookies_handled"])
+
+            # The banner stayed away over the restored cookies, so the next URL is not probed again.
+            params.pop("_cookies_handled")
+            second._apply_cookie_consent(params)
+            second._page.wait_for_function.assert_called_once()
+            self.assertTrue(params["_cookies_handled"])
+
+    def test_restored_cookies_that_no_longer_hold_still_get_the_banner_clicked(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = os.path.join(tmp, "cookies.json")
+            Path(state_path).write_text(json.dumps({"cookies": [{"name": "OptanonConsent", "value": "old"}]}))
+            params = {"cookie_state_path": state_path}
+
+            client = self._client()
+            client._page.wait_for_function.return_value.json_value.return_value = 1
+            client._load_storage_state(params)
+            with patch.object(client, "_click_selector", return_value=True) as click:
+                client._apply_cookie_consent(params)
+
+            click.assert_called_once()
+            client._context.storage_state.assert_called_once_with(path=state_path)
+
+    def test_scroll_waits_for_next_match_instead_of_polling_count(self):
+        client = self._client()
+        params = {
+            "scroll_action": "down",
+            "scroll_px": 300,
+            "scroll_pause": 0,
+            "scroll_wait_increase_selector": ".card",
+            "scroll_prev_count": 12,
+            "scroll_wait_time": 5,
+        }
+
+        client._apply_scroll_action(params)
+
+        client._page.evaluate.assert_called_once_with("(px) => window.scrollBy(0, px)", 300)
+        client._page.locator.assert_called_once_with(".card")
+        client._page.locator.return_value.count.assert_not_called()
+        client._page.locator.return_value.nth.assert_called_once_with(12)
+        client._page.locator.return_value.nth.return_value.wait_for.assert_called_once_with(state="attached", timeout=5000)
+
 
 if __name__ == "__main__":
     unittest.main()
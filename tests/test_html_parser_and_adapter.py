@@ -1,7 +1,10 @@
 import unittest
+from unittest.mock import Mock
 
+from src.scraper_framework.adapters.sites.books_toscrape import BooksToScrapeAdapter
 from src.scraper_framework.adapters.sites.directory_generic import GenericDirectoryAdapter
-from src.scraper_framework.core.models import Page, RequestSpec
+from src.scraper_framework.core.models import Page, Record, RequestSpec
+from src.scraper_framework.enrich.detail_page import DetailPageEnricher
 from src.scraper_framework.parse.parsers import HtmlPageParser
 
 HTML = """
@@ -24,6 +27,22 @@ HTML = """
 </html>
 """
 
+BOOKS_HTML = """
+<html>
+  <body>
+    <ol class="row">
+      <li>
+        <article class="product_pod">
+          <p class="star-rating Three"></p>
+          <h3><a href="catalogue/book_1/index.html" title="Book One">Book One</a></h3>
+          <div class="product_price"><p class="price_color">\u00a351.77</p></div>
+        </article>
+      </li>
+    </ol>
+  </body>
+</html>
+"""
+
 
 class TestHtmlParserAndAdapter(unittest.TestCase):
     def test_parser_finds_cards(self):
@@ -33,6 +52,7 @@ class TestHtmlParserAndAdapter(unittest.TestCase):
 
         cards = parser.parse_cards(page, adapter)
         self.assertEqual(len(cards), 2)
+        self.assertIs(page.cards, cards)
 
     def test_adapter_extracts_fields(self):
         adapter = GenericDirectoryAdapter()
@@ -60,3 +80,187 @@ class TestHtmlParserAndAdapter(unittest.TestCase):
         current = RequestSpec(url=page.url)
         nxt = adapter.next_request(page, current)
         self.assertIsNone(nxt)
+
+    def test_books_rating_class_survives_parser(self):
+        adapter = BooksToScrapeAdapter()
+        parser = HtmlPageParser()
+        page = Page(url="https://books.toscrape.com/", status_code=200, content_type="text/html", raw=BOOKS_HTML)
+
+        cards = parser.parse_cards(page, adapter)
+        self.assertEqual(len(cards), 1)
+        self.assertEqual(adapter.extract_field(cards[0], "rating", page), "Three")
+        self.assertEqual(adapter.extract_field(cards[0], "name", page), "Book One")
+
+    def test_card_empty_locator_reads_the_card_root(self):
+        from bs4 import BeautifulSoup
+
+        from src.scraper_framework.parse.cards import HtmlCard
+
+        soup = BeautifulSoup('<a class="match live" href="/en/football/a-vs-b">A <b>vs</b> B</a>', "html.parser")
+        card = HtmlCard(soup.a)
+
+        self.assertEqual(card.get_attr("", "href"), "/en/football/a-vs-b")
+        self.assertEqual(card.get_text(""), "A vs B")
+        self.assertIsNone(card.get_attr("", "title"))
+
+    def test_card_multi_valued_attr_is_space_joined(self):
+        from bs4 import BeautifulSoup
+
+        from src.scraper_framework.parse.cards import HtmlCard
+
+        soup = BeautifulSoup('<div><p class="star-rating Three">x</p><span class="">y</span></div>', "html.parser")
+        card = HtmlCard(soup.div)
+
+        self.assertEqual(card.get_attr("p", "class"), "star-rating Three")
+        self.assertIsNone(card.get_attr("span", "class"))
+
+    def test_books_next_request_from_pager(self):
+        adapter = BooksToScrapeAdapter()
+        html = BOOKS_HTML.replace("</ol>", '</ol><ul class="pager"><li class="next"><a href="page-2.html">next</a></li></ul>')
+        page = Page(
+            url="https://books.toscrape.com/catalogue/page-1.html", status_code=200, content_type="text/html", raw=html
+        )
+
+        nxt = adapter.next_request(page, RequestSpec(url=page.url))
+        self.assertIsNotNone(nxt)
+        self.assertEqual(nxt.url, "https://books.toscrape.com/catalogue/page-2.html")
+        self.assertIsNone(
+            adapter.next_request(
+                Page(url=page.url, status_code=200, content_type="text/html", raw=BOOKS_HTML), RequestSpec(url=page.url)
+            )
+        )
+
+    def test_card_strainer_matches_class_token(self):
+        adapter = BooksToScrapeAdapter()
+        parser = HtmlPageParser()
+        html = BOOKS_HTML.replace('class="product_pod"', 'class="product_pod featured"') + (
+            '<article class="product_pod"><h3><a href="b2.html">Book Two</a></h3></article>'
+        )
+        page = Page(url="https://books.toscrape.com/", status_code=200, content_type="text/html", raw=html)
+
+        cards = parser.parse_cards(page, adapter)
+        self.assertEqual([adapter.extract_field(c, "name", page) for c in cards], ["Book One", "Book Two"])
+
+    def test_join_url_matches_urljoin(self):
+        from urllib.parse import urljoin
+
+        from src.scraper_framework.parse.html_utils import join_url
+
+        base = "https://books.toscrape.com/catalogue/page-2.html"
+        for href in ["https://acme.example/x", "book_1/index.html", "../index.html", "//cdn.example/a.png", "?page=3", ""]:
+            self.assertEqual(join_url(base, href), urljoin(base, href))
+
+    def test_find_next_url_candidate_priority(self):
+        from src.scraper_framework.parse.html_utils import find_next_url
+
+        base = "https://example.com/search"
+        cases = {
+            '<li class="next"><a href="/p/2">n</a></li><a rel="next" href="/rel">r</a>': "https://example.com/rel",
+            '<a rel="next">no href</a><a class="next" href="/cls">c</a>': "https://example.com/cls",
+            '<div class="pagination"><a aria-label="Next page" href="/aria">x</a></div>': "https://example.com/aria",
+            "": None,
+        }
+        for html, expected in cases.items():
+            self.assertEqual(find_next_url(html, base), expected, html)
+
+    def test_scroll_pagination_tracks_new_hrefs_and_stalls(self):
+        from src.scraper_framework.adapters.sites.dynamic_test import DynamicTestAdapter
+
+        adapter = DynamicTestAdapter()
+        parser = HtmlPageParser()
+        links = "".join(f'<a href="/en/football/t{i}-vs-u{i}">m</a>' for i in range(3))
+        url = "https://example.com/en/football"
+
+        current = RequestSpec(url=url, params={"scroll_stall_limit": 1})
+        page = Page(url=url, status_code=200, content_type="text/html", raw=f"<div>{links}</div>")
+        parser.parse_cards(page, adapter)
+        nxt = adapter.next_request(page, current)
+
+        self.assertIsNotNone(nxt)
+        self.assertEqual(nxt.params["scroll_unique_total"], 3)
+        self.assertEqual(nxt.params["scroll_prev_count"], 3)
+        self.assertEqual(nxt.params["scroll_cursor"], 1)
+
+        # Same DOM again: nothing new, so the stall limit stops pagination.
+        page = Page(url=url, status_code=200, content_type="text/html", raw=f"<div>{links}</div>")
+        parser.parse_cards(page, adapter)
+        self.assertIsNone(adapter.next_request(page, nxt))
+
+    def test_dynamic_next_request_leaves_current_seen_hrefs_untouched(self):
+        from src.scraper_framework.adapters.sites.dynamic_test import DynamicTestAdapter
+
+        adapter = DynamicTestAdapter()
+        parser = HtmlPageParser()
+        url = "https://example.com/en/football"
+        seen = {"https://example.com/en/football/t0-vs-u0"}
+        current = RequestSpec(url=url, params={"scroll_seen_hrefs": seen})
+        links = "".join(f'<a href="/en/football/t{i}-vs-u{i}">m</a>' for i in range(2))
+        page = Page(url=url, status_code=200, content_type="text/html", raw=f"<div>{links}</div>")
+        parser.parse_cards(page, adapter)
+
+        nxt = adapter.next_request(page, current)
+
+        self.assertEqual(len(nxt.params["scroll_seen_hrefs"]), 2)
+        self.assertEqual(current.params["scroll_seen_hrefs"], {"https://example.com/en/football/t0-vs-u0"})
+
+    def test_detail_enricher_fills_only_missing_fields(self):
+        fetcher = Mock()
+        fetcher.fetch.return_value = Page(
+            url="https://example.com/biz/1",
+            status_code=200,
+            content_type="text/html",
+            raw='<html><body><p class="availability"> In\n stock </p><p class="address">Elsewhere</p></body></html>',
+        )
+        enricher = DetailPageEnricher(fetcher=fetcher, fields={"availability", "address"})
+        record = Record(id="1", source_url="https://example.com/biz/1", scraped_at_utc="", fields={"address": "Berlin"})
+
+        self.assertTrue(enricher.should_enrich(record))
+        self.assertFalse(enricher.should_enrich(Record(id="2", source_url="", scraped_at_utc="", fields={})))
+        enricher.enrich(record, GenericDirectoryAdapter())
+
+        self.assertEqual(record.fields, {"address": "Berlin", "availability": "In\n stock"})
+        self.assertEqual(fetcher.fetch.call_args.args[0].url, "https://example.com/biz/1")
+
+        # A repeated listing reuses the parsed detail page.
+        repeat = Record(id="1", source_url="https://example.com/biz/1", scraped_at_utc="", fields={})
+        enricher.enrich(repeat, GenericDirectoryAdapter())
+        self.assertEqual(repeat.fields, {"availability": "In\n stock"})
+        self.assertEqual(fetcher.fetch.call_count, 1)
+
+    def test_detail_enricher_matches_each_locator_in_one_pass(self):
+        locators = {
+            "detail:phone": ".phone",
+            "detail:website": "a.site, .web",
+            "detail:address": "div.card",
+            "detail:email": ".email",
+        }
+        adapter = Mock()
+        adapter.field_locator.side_effect = locators.get
+        fetcher = Mock()
+        fetcher.fetch.return_value = Page(
+            url="https://example.com/d",
+            status_code=200,
+            content_type="text/html",
+            raw=(
+                '<div class="card"><span class="web">W1</span><span class="phone">P1</span></div>'
+                '<span class="phone">P2</span><a class="site">W2</a>'
+            ),
+        )
+        enricher = DetailPageEnricher(fetcher=fetcher, fields={"phone", "website", "address", "email"})
+        record = Record(id="1", source_url="https://example.com/d", scraped_at_utc="", fields={})
+
+        enricher.enrich(record, adapter)
+
+        self.assertEqual(record.fields, {"address": "W1 P1", "website": "W1", "phone": "P1"})
+
+    def test_detail_enricher_skips_fetch_without_detail_locators(self):
+        adapter = Mock()
+        adapter.field_locator.return_value = None
+        fetcher = Mock()
+        enricher = DetailPageEnricher(fetcher=fetcher, fields={"phone"})
+        record = Record(id="1", source_url="https://example.com/d", scraped_at_utc="", fields={})
+
+        enricher.enrich(record, adapter)
+
+        fetcher.fetch.assert_not_called()
+        self.assertEqual(record.fields, {})
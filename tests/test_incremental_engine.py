@@ -1,18 +1,24 @@
 import os
+import sqlite3
 import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.scraper_framework.core.engine import ScrapeEngine
 from src.scraper_framework.core.models import (
     IncrementalConfig,
     Page,
+    ProcessingConfig,
     RequestSpec,
     ScrapeJob,
     ValidationResult,
 )
+from src.scraper_framework.process.registry import create_default_registry
+from src.scraper_framework.process.runner import ProcessingRunner
 from src.scraper_framework.state.sqlite_store import SQLiteIncrementalStateStore
 from src.scraper_framework.transform.dedupe import UrlDedupeStrategy
+from src.scraper_framework.transform.normalizers import DefaultNormalizer
+from src.scraper_framework.transform.validators import RequiredFieldsValidator
 
 
 class TestIncrementalEngine(unittest.TestCase):
@@ -91,6 +97,214 @@ class TestIncrementalEngine(unittest.TestCase):
         written_counts = [len(call.args[1]) for call in sink.write.call_args_list]
         self.assertEqual(written_counts, [1, 0, 1])
 
+    def test_stream_mode_reuses_dedupe_keys_for_incremental_state(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+        deduper = UrlDedupeStrategy()
+
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = [object()] * 3
+        parser.next_request.return_value = None
+        adapter.extract_source_url.side_effect = [f"https://example.com/item/{i}" for i in range(3)]
+        adapter.extract_field.return_value = "name"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=deduper,
+            sink=sink,
+            state_store=SQLiteIncrementalStateStore(self.state_path),
+        )
+
+        job = ScrapeJob(
+            id="incremental-stream",
+            name="incremental-stream",
+            start=RequestSpec(url="https://example.com"),
+            execution_mode="stream",
+            batch_size=10,
+            delay_ms=0,
+            max_pages=1,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            incremental=IncrementalConfig(enabled=True, state_path=self.state_path, mode="changed_only"),
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        with patch.object(deduper, "key", wraps=deduper.key) as key_spy:
+            report = engine.run(job)
+
+        self.assertEqual(report.records_emitted, 3)
+        # One key per record in the chunk dedupe pass; _apply_incremental reuses those keys.
+        self.assertEqual(key_spy.call_count, 3)
+
+    def test_new_only_skips_known_records_before_enrich(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+        enricher = Mock()
+
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = [object(), object()]
+        parser.next_request.return_value = None
+        adapter.extract_field.return_value = "name"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+        enricher.should_enrich.return_value = True
+        enricher.enrich.side_effect = lambda rec, _adapter: rec
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+            enricher=enricher,
+            state_store=SQLiteIncrementalStateStore(self.state_path),
+        )
+
+        job = ScrapeJob(
+            id="incremental-new-only",
+            name="incremental-new-only",
+            start=RequestSpec(url="https://example.com"),
+            delay_ms=0,
+            max_pages=1,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            incremental=IncrementalConfig(enabled=True, state_path=self.state_path, mode="new_only"),
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        adapter.extract_source_url.side_effect = ["https://example.com/item/1", "https://example.com/item/2"]
+        report_1 = engine.run(job)
+        self.assertEqual(report_1.records_emitted, 2)
+
+        enricher.enrich.reset_mock()
+        normalizer.normalize.reset_mock()
+        adapter.extract_source_url.side_effect = ["https://example.com/item/1", "https://example.com/item/3"]
+        report_2 = engine.run(job)
+
+        self.assertEqual(report_2.records_emitted, 1)
+        self.assertEqual(report_2.records_skipped_incremental, 1)
+        # Only the new record was enriched; the known one is still normalized and validated.
+        self.assertEqual(enricher.enrich.call_count, 1)
+        self.assertEqual(normalizer.normalize.call_count, 2)
+        self.assertEqual(sink.write.call_args.args[1][0].source_url, "https://example.com/item/3")
+
+    def _run_new_only_twice(self, processing_enabled: bool):
+        state_path = os.path.join(self.tmp_dir, f"state-{processing_enabled}.db")
+        parser = Mock()
+        adapter = Mock()
+        fetcher = Mock()
+        fetcher.fetch.return_value = Page(url="https://example.com", status_code=200, content_type="text/html", raw="")
+        parser.next_request.return_value = None
+        adapter.extract_source_url.side_effect = lambda card, _page: card["url"]
+        adapter.extract_field.side_effect = lambda card, field, _page: card.get(field)
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=DefaultNormalizer(),
+            validator=RequiredFieldsValidator(),
+            deduper=UrlDedupeStrategy(),
+            sink=Mock(),
+            processor_runner=ProcessingRunner(create_default_registry()),
+            state_store=SQLiteIncrementalStateStore(state_path),
+        )
+        job = ScrapeJob(
+            id="new-only-paths",
+            name="new-only-paths",
+            start=RequestSpec(url="https://example.com"),
+            delay_ms=0,
+            max_pages=1,
+            required_fields={"source_url", "name"},
+            field_schema=["name"],
+            processing=ProcessingConfig(enabled=processing_enabled),
+            incremental=IncrementalConfig(enabled=True, state_path=state_path, mode="new_only"),
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        parser.parse_cards.return_value = [
+            {"url": "https://example.com/item/1", "name": "One"},
+            {"url": "https://example.com/item/2", "name": "Two"},
+        ]
+        engine.run(job)
+        parser.parse_cards.return_value = [
+            {"url": "https://example.com/item/1", "name": "One, renamed"},  # known, changed
+            {"url": "https://example.com/item/2", "name": None},  # known, now invalid
+            {"url": "https://example.com/item/3", "name": "Three"},  # new
+        ]
+        report = engine.run(job)
+
+        with sqlite3.connect(state_path) as conn:
+            rows = conn.execute(
+                "SELECT dedupe_key, content_hash, seen_count, last_changed_utc = first_seen_utc"
+                " FROM record_state ORDER BY dedupe_key"
+            ).fetchall()
+        return rows, report
+
+    def test_new_only_state_is_the_same_with_and_without_processing(self):
+        rows_plain, report_plain = self._run_new_only_twice(processing_enabled=False)
+        rows_processed, report_processed = self._run_new_only_twice(processing_enabled=True)
+
+        self.assertEqual(rows_plain, rows_processed)
+        # The changed record keeps its first content hash; the invalid one is not touched.
+        self.assertEqual(
+            [(key, seen, unchanged) for key, _, seen, unchanged in rows_plain][:2],
+            [
+                ("https://example.com/item/1", 2, 1),
+                ("https://example.com/item/2", 1, 1),
+            ],
+        )
+        for report in (report_plain, report_processed):
+            self.assertEqual(report.records_emitted, 1)
+            self.assertEqual(report.records_skipped_incremental, 1)
+        self.assertEqual(report_plain.failures, report_processed.failures)
+        self.assertEqual(sum(report_plain.failures.values()), 1)
+
+    def test_checkpoint_payload_serializes_seen_href_sets(self):
+        engine = ScrapeEngine(
+            fetcher=Mock(),
+            parser=Mock(),
+            adapter=Mock(),
+            normalizer=Mock(),
+            validator=Mock(),
+            deduper=UrlDedupeStrategy(),
+            sink=Mock(),
+        )
+        req = RequestSpec(url="https://example.com", params={"scroll_seen_hrefs": {"a", "b"}, "scroll_cursor": 2})
+
+        payload = engine._request_to_payload(req)
+        self.assertEqual(sorted(payload["params"]["scroll_seen_hrefs"]), ["a", "b"])
+        self.assertEqual(payload["params"]["scroll_cursor"], 2)
+
+        restored = engine._request_from_payload(payload)
+        self.assertEqual(sorted(restored.params["scroll_seen_hrefs"]), ["a", "b"])
+
 
 if __name__ == "__main__":
     unittest.main()
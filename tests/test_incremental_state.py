@@ -2,6 +2,7 @@ import os
 import tempfile
 import unittest
 
+from src.scraper_framework.state.checkpoint_writer import BackgroundCheckpointWriter
 from src.scraper_framework.state.sqlite_store import SQLiteIncrementalStateStore
 
 
@@ -47,6 +48,41 @@ class TestSQLiteIncrementalStateStore(unittest.TestCase):
         self.assertFalse(decision_3.is_new)
         self.assertTrue(decision_3.changed)
 
+    def test_decide_and_touch_many_matches_sequential_calls(self):
+        self.store.decide_and_touch("job-d", "https://example.com/1", "h1", "changed_only")
+        items = [
+            ("https://example.com/1", "h1"),  # unchanged
+            ("https://example.com/2", "h2"),  # new
+            ("https://example.com/2", "h2"),  # repeated in batch -> sees the insert above
+            ("https://example.com/1", "h9"),  # changed
+        ]
+        decisions = self.store.decide_and_touch_many("job-d", items, "changed_only")
+        self.assertEqual([d.emit for d in decisions], [False, True, False, True])
+        self.assertEqual([d.is_new for d in decisions], [False, True, False, False])
+        self.assertEqual([d.changed for d in decisions], [False, True, False, True])
+
+        after = self.store.decide_and_touch("job-d", "https://example.com/1", "h9", "changed_only")
+        self.assertFalse(after.changed)
+        self.assertEqual(self.store.decide_and_touch_many("job-d", [], "new_only"), [])
+        with self.assertRaises(ValueError):
+            self.store.decide_and_touch_many("job-d", [("  ", "h")], "changed_only")
+
+    def test_find_known_keys_returns_existing_keys(self):
+        self.store.decide_and_touch("job-f", "https://example.com/1", "h1", "new_only")
+        known = self.store.find_known_keys("job-f", ["https://example.com/1", "https://example.com/2", ""])
+        self.assertEqual(known, {"https://example.com/1"})
+        # looking keys up does not create state for unknown ones
+        self.assertTrue(self.store.decide_and_touch("job-f", "https://example.com/2", "h2", "new_only").is_new)
+
+    def test_new_only_keeps_stored_content_hash_of_known_keys(self):
+        self.store.decide_and_touch("job-g", "https://example.com/1", "h1", "new_only")
+        decision = self.store.decide_and_touch("job-g", "https://example.com/1", "h2", "new_only")
+        self.assertFalse(decision.emit)
+        self.assertTrue(decision.changed)
+
+        # The change seen in new_only mode is still reported by a later changed_only run.
+        self.assertTrue(self.store.decide_and_touch("job-g", "https://example.com/1", "h2", "changed_only").emit)
+
     def test_checkpoint_roundtrip(self):
         payload = {
             "url": "https://example.com/page-2",
@@ -65,6 +101,19 @@ class TestSQLiteIncrementalStateStore(unittest.TestCase):
         self.store.clear_checkpoint("job-b")
         self.assertIsNone(self.store.load_checkpoint("job-b"))
 
+    def test_background_checkpoint_writer_persists_latest_snapshot(self):
+        writer = BackgroundCheckpointWriter(self.store)
+        params = {"seen": ["a"]}
+        writer.submit("job-e", {"url": "https://example.com/page-1", "params": params}, page_index=1)
+        writer.submit("job-e", {"url": "https://example.com/page-2", "params": params}, page_index=2)
+        params["_cookies_handled"] = True  # set by a client after submit; the queued snapshot must not change
+        writer.close()
+
+        checkpoint = self.store.load_checkpoint("job-e")
+        self.assertEqual(checkpoint.page_index, 2)
+        self.assertEqual(checkpoint.request_payload["url"], "https://example.com/page-2")
+        self.assertEqual(checkpoint.request_payload["params"], {"seen": ["a"]})
+
     def test_run_counter(self):
         first = self.store.mark_run_started("job-c")
         second = self.store.mark_run_started("job-c")
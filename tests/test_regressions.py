@@ -5,8 +5,12 @@ Regression tests for previously identified behavior issues.
 import unittest
 from unittest.mock import Mock
 
+import requests
+
 from src.scraper_framework.core.engine import ScrapeEngine
 from src.scraper_framework.core.models import Page, RequestSpec, ScrapeJob, ValidationResult
+from src.scraper_framework.fetch.strategies import StaticHtmlFetchStrategy
+from src.scraper_framework.http.client import RequestsHttpClient
 from src.scraper_framework.sinks.gsheet_sink import GoogleSheetsSink
 from src.scraper_framework.transform.dedupe import UrlDedupeStrategy
 
@@ -100,5 +104,23 @@ class TestEngineMetricsAfterDedupe(unittest.TestCase):
         self.assertEqual(len(written_records), 1)
 
 
+class TestResponseHeaders(unittest.TestCase):
+    """Ensure response headers are looked up case-insensitively."""
+
+    def test_lowercase_content_type_header_reaches_page(self):
+        raw = requests.Response()
+        raw.status_code = 200
+        raw.headers["content-type"] = "text/html; charset=utf-8"
+        raw._content = b"<html></html>"
+
+        client = RequestsHttpClient()
+        client.session = Mock()
+        client.session.request.return_value = raw
+
+        page = StaticHtmlFetchStrategy(client).fetch(RequestSpec(url="https://example.com"))
+
+        self.assertEqual(page.content_type, "text/html; charset=utf-8")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,11 +6,13 @@ import json
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 from unittest.mock import Mock
 
 from src.scraper_framework.core.engine import ScrapeEngine
 from src.scraper_framework.core.models import (
+    EnrichConfig,
     Page,
     ProcessingConfig,
     ProcessingStage,
@@ -93,6 +95,108 @@ class TestStreamingEngine(unittest.TestCase):
         written_counts = [len(call.args[1]) for call in sink.write.call_args_list]
         self.assertEqual(written_counts, [2, 1])
 
+    def test_stream_mode_coalesces_sink_writes_across_chunks(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = [object()] * 7
+        parser.next_request.return_value = None
+        adapter.extract_source_url.side_effect = [f"https://example.com/{i}" for i in range(7)]
+        adapter.extract_field.return_value = "x"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+        )
+
+        job = ScrapeJob(
+            id="stream-coalesce",
+            name="stream-coalesce",
+            start=RequestSpec(url="https://example.com"),
+            execution_mode="stream",
+            batch_size=2,
+            sink_flush_records=5,
+            delay_ms=0,
+            max_pages=1,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        report = engine.run(job)
+        self.assertEqual(report.records_emitted, 7)
+        # chunks of 2 are buffered until 5+ records are pending; the tail is written at the end
+        written_counts = [len(call.args[1]) for call in sink.write.call_args_list]
+        self.assertEqual(written_counts, [6, 1])
+
+    def test_stream_mode_writes_buffered_records_when_a_later_page_fails(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+
+        fetcher.fetch.side_effect = [
+            Page(url="https://example.com", status_code=200, content_type="text/html", raw="<html></html>"),
+            RuntimeError("page 2 failed"),
+        ]
+        parser.parse_cards.return_value = [object()] * 3
+        parser.next_request.return_value = RequestSpec(url="https://example.com/page/2")
+        adapter.extract_source_url.side_effect = [f"https://example.com/{i}" for i in range(3)]
+        adapter.extract_field.return_value = "x"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+        )
+
+        job = ScrapeJob(
+            id="stream-failure",
+            name="stream-failure",
+            start=RequestSpec(url="https://example.com"),
+            execution_mode="stream",
+            batch_size=2,
+            sink_flush_records=10,
+            delay_ms=0,
+            max_pages=2,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        with self.assertRaises(RuntimeError):
+            engine.run(job)
+
+        # The flushed chunk was still below sink_flush_records when page 2 failed.
+        sink.write.assert_called_once()
+        written = sink.write.call_args.args[1]
+        self.assertEqual([r.source_url for r in written], ["https://example.com/0", "https://example.com/1"])
+
     def test_stream_mode_aggregates_processing_stage_metrics(self):
         fetcher = Mock()
         parser = Mock()
@@ -164,6 +268,279 @@ class TestStreamingEngine(unittest.TestCase):
 
 
 class TestStreamingSinkWrites(unittest.TestCase):
+    def test_prefetch_next_page_fetches_following_pages_in_background(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+
+        fetch_threads = []
+
+        def fetch(req):
+            fetch_threads.append(threading.current_thread())
+            return Page(url=req.url, status_code=200, content_type="text/html", raw="<html></html>")
+
+        def next_request(page, _adapter, current):
+            n = int(current.url.rsplit("/", 1)[1])
+            return RequestSpec(url=f"https://example.com/{n + 1}")
+
+        fetcher.fetch.side_effect = fetch
+        parser.parse_cards.return_value = [object()]
+        parser.next_request.side_effect = next_request
+        adapter.mode.return_value = "HTML"
+        adapter.extract_source_url.side_effect = lambda card, page: page.url + "/item"
+        adapter.extract_field.return_value = "x"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+        )
+
+        job = ScrapeJob(
+            id="prefetch",
+            name="prefetch",
+            start=RequestSpec(url="https://example.com/1"),
+            delay_ms=0,
+            max_pages=3,
+            prefetch_next_page=True,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        report = engine.run(job)
+
+        self.assertEqual(report.pages_fetched, 3)
+        self.assertEqual(
+            [c.args[0].url for c in fetcher.fetch.call_args_list], [f"https://example.com/{n}" for n in (1, 2, 3)]
+        )
+        self.assertIs(fetch_threads[0], threading.current_thread())
+        self.assertTrue(all(t is not threading.current_thread() for t in fetch_threads[1:]))
+        written = sink.write.call_args.args[1]
+        self.assertEqual([r.source_url for r in written], [f"https://example.com/{n}/item" for n in (1, 2, 3)])
+
+    def test_prefetch_next_page_for_dynamic_adapters_only_with_selenium_and_no_enricher(self):
+        adapter = Mock()
+        adapter.mode.return_value = "DYNAMIC"
+
+        def prefetch_enabled(dynamic_engine, enricher):
+            engine = ScrapeEngine(
+                fetcher=Mock(),
+                parser=Mock(),
+                adapter=adapter,
+                normalizer=Mock(),
+                validator=Mock(),
+                deduper=UrlDedupeStrategy(),
+                sink=Mock(),
+                enricher=enricher,
+            )
+            job = ScrapeJob(
+                id="prefetch-dynamic",
+                name="prefetch-dynamic",
+                start=RequestSpec(url="https://example.com"),
+                prefetch_next_page=True,
+                dynamic_engine=dynamic_engine,
+            )
+            return engine._prefetch_enabled(job)
+
+        self.assertTrue(prefetch_enabled("selenium", None))
+        self.assertFalse(prefetch_enabled("selenium", Mock()))
+        self.assertFalse(prefetch_enabled("playwright", None))
+
+    def test_enrich_workers_fetch_detail_pages_concurrently_in_card_order(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+        enricher = Mock()
+
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = [object()] * 4
+        parser.next_request.return_value = None
+        adapter.mode.return_value = "HTML"
+        adapter.extract_source_url.side_effect = [f"https://example.com/{i}" for i in range(4)]
+        adapter.extract_field.return_value = ""
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+
+        barrier = threading.Barrier(2, timeout=5)
+        enrich_threads = set()
+
+        def enrich(record, _adapter):
+            enrich_threads.add(threading.current_thread().name)
+            barrier.wait()  # only passes if two detail fetches are in flight at once
+            record.fields["name"] = record.source_url.rsplit("/", 1)[1]
+            return record
+
+        enricher.should_enrich.return_value = True
+        enricher.enrich.side_effect = enrich
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+            enricher=enricher,
+        )
+
+        job = ScrapeJob(
+            id="enrich-workers",
+            name="enrich-workers",
+            start=RequestSpec(url="https://example.com"),
+            delay_ms=0,
+            max_pages=1,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            enrich=EnrichConfig(enabled=True, fields={"name"}, workers=2),
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        report = engine.run(job)
+
+        self.assertEqual(report.records_emitted, 4)
+        written = sink.write.call_args.args[1]
+        self.assertEqual([r.fields["name"] for r in written], ["0", "1", "2", "3"])
+        self.assertTrue(all(name.startswith("enrich") for name in enrich_threads))
+        self.assertIsNone(engine._enrich_pool)
+
+    def test_stream_mode_skips_enrichment_for_cards_emitted_in_earlier_chunks(self):
+        fetcher = Mock()
+        parser = Mock()
+        adapter = Mock()
+        normalizer = Mock()
+        validator = Mock()
+        sink = Mock()
+        enricher = Mock()
+
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = [object(), object()]
+        parser.next_request.side_effect = [RequestSpec(url="https://example.com/?page=2"), None]
+        adapter.mode.return_value = "HTML"
+        adapter.extract_source_url.side_effect = [
+            "https://example.com/1",
+            "https://example.com/2",
+            "https://example.com/2",  # repeated listing on page 2
+            "https://example.com/3",
+        ]
+        adapter.extract_field.return_value = "x"
+        normalizer.normalize.side_effect = lambda rec: rec
+        validator.validate.return_value = ValidationResult(ok=True, reason="")
+        enricher.should_enrich.return_value = True
+        enricher.enrich.side_effect = lambda record, _adapter: record
+
+        engine = ScrapeEngine(
+            fetcher=fetcher,
+            parser=parser,
+            adapter=adapter,
+            normalizer=normalizer,
+            validator=validator,
+            deduper=UrlDedupeStrategy(),
+            sink=sink,
+            enricher=enricher,
+        )
+
+        job = ScrapeJob(
+            id="stream-pre-enrich-dedupe",
+            name="stream-pre-enrich-dedupe",
+            start=RequestSpec(url="https://example.com"),
+            execution_mode="stream",
+            batch_size=2,
+            delay_ms=0,
+            max_pages=2,
+            required_fields={"source_url"},
+            field_schema=["name"],
+            enrich=EnrichConfig(enabled=True, fields={"name"}),
+            sink_config={"type": "jsonl", "path": "unused.jsonl", "write_mode": "overwrite"},
+        )
+
+        with self.assertLogs("scraper_framework.engine", level="INFO") as logs:
+            report = engine.run(job)
+        self.assertEqual(report.records_emitted, 3)
+        enriched_urls = [call.args[0].source_url for call in enricher.enrich.call_args_list]
+        self.assertEqual(enriched_urls, ["https://example.com/1", "https://example.com/2", "https://example.com/3"])
+        # The card skipped before enrichment is still reported with the chunk it would have been in.
+        summaries = [line for line in logs.output if "Chunk flushed" in line]
+        self.assertIn("index=2 input=2 local_unique=2 cross_chunk_duplicates=1 emitted=1", summaries[1])
+
+    def test_empty_stream_run_writes_only_to_sinks_that_create_empty_output(self):
+        class RemoteSink:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, job, records):
+                self.writes.append(list(records))
+
+        fetcher = Mock()
+        parser = Mock()
+        fetcher.fetch.return_value = Page(
+            url="https://example.com",
+            status_code=200,
+            content_type="text/html",
+            raw="<html></html>",
+        )
+        parser.parse_cards.return_value = []
+        parser.next_request.return_value = None
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "empty.csv")
+            remote_sink = RemoteSink()
+            for sink, sink_config in [
+                (remote_sink, {"type": "remote"}),
+                (CsvSink(), {"type": "csv", "path": path, "write_mode": "overwrite"}),
+            ]:
+                engine = ScrapeEngine(
+                    fetcher=fetcher,
+                    parser=parser,
+                    adapter=Mock(),
+                    normalizer=Mock(),
+                    validator=Mock(),
+                    deduper=UrlDedupeStrategy(),
+                    sink=sink,
+                )
+                job = ScrapeJob(
+                    id="stream-empty",
+                    name="stream-empty",
+                    start=RequestSpec(url="https://example.com"),
+                    execution_mode="stream",
+                    delay_ms=0,
+                    max_pages=1,
+                    required_fields={"source_url"},
+                    field_schema=["name"],
+                    sink_config=sink_config,
+                )
+                self.assertEqual(engine.run(job).records_emitted, 0)
+
+            self.assertEqual(remote_sink.writes, [])
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read().strip(), "id,source_url,scraped_at_utc,name")
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
     def test_csv_stream_overwrite_truncates_once_then_appends(self):
         sink = CsvSink()
         tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
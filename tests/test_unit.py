@@ -3,6 +3,11 @@ Unit tests for core scraper components.
 Fast, focused tests for individual components.
 """
 
+import logging
+import logging.handlers
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import Mock
 
@@ -10,9 +15,11 @@ from pydantic import ValidationError
 
 from src.scraper_framework.adapters.registry import get, get_registered_adapters, register
 from src.scraper_framework.config_models import ScraperConfig
-from src.scraper_framework.core.models import Record
+from src.scraper_framework.core.models import Record, RequestSpec
 from src.scraper_framework.transform.dedupe import HashDedupeStrategy, UrlDedupeStrategy
 from src.scraper_framework.transform.validators import RequiredFieldsValidator
+from src.scraper_framework.utils import logging as logging_utils
+from src.scraper_framework.utils.hashing import normalize_text, normalized_hash, stable_hash
 
 
 class TestValidators(unittest.TestCase):
@@ -237,6 +244,80 @@ class TestConfigValidation(unittest.TestCase):
         with self.assertRaises(ValidationError):
             ScraperConfig(**config_data)
 
+    def test_unknown_config_keys_rejected(self):
+        """Test that misspelled/unknown config keys are rejected instead of ignored."""
+        config_data = {
+            "job": {"id": "test", "name": "Test Job", "adapter": "test_adapter", "start_url": "https://example.com"},
+            "sink": {"type": "csv", "path": "test.csv", "write_mod": "append"},
+        }
+        with self.assertRaises(ValidationError) as cm:
+            ScraperConfig(**config_data)
+        self.assertIn("write_mod", str(cm.exception))
+
+    def test_enabled_schedule_defaults_interval_and_config_is_frozen(self):
+        """Test enabled schedule without cron defaults to 24h and validated config is immutable."""
+        config_data = {
+            "job": {"id": "test", "name": "Test Job", "adapter": "test_adapter", "start_url": "https://example.com"},
+            "sink": {"type": "csv", "path": "test.csv"},
+            "schedule": {"enabled": True},
+        }
+        config = ScraperConfig(**config_data)
+        self.assertEqual(config.schedule.interval_hours, 24)
+        with self.assertRaises(ValidationError):
+            config.job.max_pages = 10
+
+    def test_omitted_sections_share_default_instances(self):
+        """Test that configs without optional sections share the frozen defaults."""
+        config_data = {
+            "job": {"id": "test", "name": "Test Job", "adapter": "test_adapter", "start_url": "https://example.com"},
+            "sink": {"type": "csv", "path": "test.csv"},
+        }
+        first = ScraperConfig(**config_data)
+        second = ScraperConfig(**config_data)
+        self.assertIs(first.enrich, second.enrich)
+        self.assertIs(first.processing, second.processing)
+        self.assertIs(first.schedule, second.schedule)
+        self.assertIs(first.incremental, second.incremental)
+        self.assertFalse(first.schedule.enabled)
+        self.assertEqual(first.incremental.state_path, "output/state.db")
+
+    def test_load_config_reuses_validated_config_until_file_changes(self):
+        """Test that reloading an unchanged config file returns the cached instance."""
+        import os
+        import tempfile
+
+        from src.scraper_framework.config_models import load_and_validate_config
+
+        yaml_text = (
+            "job:\n  id: t\n  name: T\n  adapter: a\n  start_url: https://example.com\n"
+            "sink:\n  type: csv\n  path: out.csv\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "job.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(yaml_text)
+
+            first = load_and_validate_config(path)
+            self.assertIs(load_and_validate_config(path), first)
+
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(yaml_text.replace("out.csv", "new.csv"))
+            second = load_and_validate_config(path)
+            self.assertIsNot(second, first)
+            self.assertEqual(second.sink.path, "new.csv")
+
+    def test_job_objects_do_not_share_request_dicts_with_cached_config(self):
+        """Test that per-run params written by clients do not leak into later loads of the same file."""
+        from src.scraper_framework.config_models import config_to_job_objects, load_and_validate_config
+
+        job, _, _ = config_to_job_objects(load_and_validate_config("configs/jobs/client_template.yaml"))
+        job.start.params["_cookies_handled"] = True
+        job.start.headers["X-Run"] = "1"
+
+        reloaded, _, _ = config_to_job_objects(load_and_validate_config("configs/jobs/client_template.yaml"))
+        self.assertNotIn("_cookies_handled", reloaded.start.params)
+        self.assertNotIn("X-Run", reloaded.start.headers)
+
 
 class TestAdapterRegistry(unittest.TestCase):
     """Test adapter registry functionality."""
@@ -291,5 +372,106 @@ class TestAdapterRegistry(unittest.TestCase):
         self.assertIn(mock_adapter2, adapters)
 
 
+class TestRequestSpec(unittest.TestCase):
+    """Test RequestSpec helpers."""
+
+    def test_with_params_copies_on_write(self):
+        """Test that with_params merges updates without mutating the original spec."""
+        seen = {"https://example.com/a"}
+        current = RequestSpec(url="https://example.com", headers={"X": "1"}, params={"cursor": 1, "seen": seen})
+
+        nxt = current.with_params(cursor=2)
+
+        self.assertEqual(current.params["cursor"], 1)
+        self.assertEqual(nxt.params["cursor"], 2)
+        self.assertIs(nxt.params["seen"], seen)
+        self.assertEqual(nxt.url, current.url)
+        self.assertEqual(nxt.headers, current.headers)
+
+
+class TestNormalizeText(unittest.TestCase):
+    """Test text normalization used for record ids and content hashes."""
+
+    def test_collapses_whitespace_and_line_endings(self):
+        """Test that all whitespace runs, including CR/LF and NBSP, collapse to one space."""
+        self.assertEqual(normalize_text("  Foo\r\n\tBar\u00a0 Baz \n"), "foo bar baz")
+        self.assertEqual(normalize_text("  A\r\nB ", lowercase=False), "A B")
+
+    def test_unicode_normalized_only_when_needed(self):
+        """Test NFKC folding of non-ASCII text and the non-default option paths."""
+        self.assertEqual(normalize_text("\ufb01le \u2460"), "file 1")
+        self.assertEqual(normalize_text(" a\r\nb ", strip=False), " a b ")
+        self.assertEqual(normalize_text(" a\r\nb ", collapse_whitespace=False), "a\nb")
+        self.assertEqual(normalize_text(None), "")
+
+    def test_normalized_hash_matches_uncached_composition(self):
+        """Test the cached hash equals stable_hash(normalize_text(...)) so persisted ids stay unchanged."""
+        url = " HTTPS://Example.com/Item/1 "
+        self.assertEqual(normalized_hash(url), stable_hash(normalize_text(url)))
+        self.assertEqual(normalized_hash(url), normalized_hash("https://example.com/item/1"))
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test queued logging setup."""
+
+    def tearDown(self):
+        logging_utils.stop_queued_logging()
+        logging.getLogger("queued_test").handlers.clear()
+
+    def test_configured_handlers_run_on_listener_thread(self):
+        """Test configured handlers are moved behind a queue and drained on stop."""
+        config = (
+            "version: 1\n"
+            "disable_existing_loggers: false\n"
+            "handlers:\n"
+            "  memory:\n"
+            "    class: logging.handlers.MemoryHandler\n"
+            "    capacity: 100\n"
+            "loggers:\n"
+            "  queued_test:\n"
+            "    level: INFO\n"
+            "    handlers: [memory]\n"
+            "    propagate: false\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logging.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(config)
+            logging_utils.setup_logging(path)
+
+        logger = logging.getLogger("queued_test")
+        self.assertEqual([type(h) for h in logger.handlers], [logging.handlers.QueueHandler])
+
+        memory = logging_utils._installed[0][2].handlers[0]
+        emit_threads = []
+        original_emit = memory.emit
+        memory.emit = lambda record: (emit_threads.append(threading.current_thread()), original_emit(record))
+
+        logger.info("page %s done", 3)
+        logging_utils.stop_queued_logging()
+
+        self.assertEqual([r.getMessage() for r in memory.buffer], ["page 3 done"])
+        self.assertNotIn(threading.current_thread(), emit_threads)
+        self.assertEqual(logger.handlers, [memory])
+
+    def test_setup_logging_twice_without_config_keeps_logging(self):
+        """Test a second fallback setup queues the original handler, not the previous queue handler."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        memory = logging.handlers.MemoryHandler(capacity=100)
+        root.handlers = [memory]
+        try:
+            logging_utils.setup_logging("/nonexistent/logging.yaml")
+            logging_utils.setup_logging("/nonexistent/logging.yaml")
+            logging.getLogger("fallback_test").warning("second")
+            logging_utils.stop_queued_logging()
+
+            self.assertEqual([r.getMessage() for r in memory.buffer], ["second"])
+            self.assertEqual(root.handlers, [memory])
+        finally:
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+
+
 if __name__ == "__main__":
     unittest.main()